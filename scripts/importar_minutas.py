@@ -10,18 +10,45 @@ Uso:
   python3 scripts/importar_minutas.py
   python3 scripts/importar_minutas.py --limite 10  # testar com 10
   python3 scripts/importar_minutas.py --reprocessar  # forçar reprocessamento
+  python3 scripts/importar_minutas.py --workers 4   # limitar paralelismo
+  python3 scripts/importar_minutas.py --full-scan   # auditoria: classificar pelo texto inteiro
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import mmap
+import os
 import re
 import subprocess
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import fitz  # PyMuPDF — carregado uma vez por processo worker
+except ImportError:  # pragma: no cover - fallback para pdftotext
+    fitz = None
+
+try:
+    import re2  # google-re2: motor DFA de tempo linear, sem backtracking
+except ImportError:  # pragma: no cover - fallback para o re da stdlib
+    re2 = None
+
+try:
+    import orjson  # serialização do índice em C (mesmo formato do json indent=2)
+except ImportError:  # pragma: no cover - fallback para o json da stdlib
+    orjson = None
+
+try:
+    import ahocorasick  # pyahocorasick: varredura multi-padrão em uma passada
+except ImportError:  # pragma: no cover - fallback para busca por substring
+    ahocorasick = None
+
 # ── Caminhos ────────────────────────────────────────────────────────────────
 BASE_DIR    = Path(__file__).resolve().parent.parent
 PDFS_DIR    = BASE_DIR / "minutas_referencia" / "pdfs"
@@ -29,31 +56,29 @@ TEXTOS_DIR  = BASE_DIR / "minutas_referencia" / "textos"
 INDEX_FILE  = BASE_DIR / "minutas_referencia" / "index.json"
 
 # ── Padrões de extração ──────────────────────────────────────────────────────
+# Os padrões de classificação são escritos em minúsculas e aplicados sobre
+# ``texto.lower()``, calculado uma única vez por PDF (sem re.I).
 
 # Tipos de recurso
-RE_RESP  = re.compile(r"recurso especial", re.I)
-RE_RE    = re.compile(r"recurso extraordin", re.I)
-RE_ARESP = re.compile(r"agravo em recurso especial|aresp", re.I)
-RE_ARE   = re.compile(r"agravo em recurso extraordin|are\b", re.I)
+RE_RESP  = re.compile(r"recurso especial")
+RE_RE    = re.compile(r"recurso extraordin")
+RE_ARESP = re.compile(r"agravo em recurso especial|aresp")
+RE_ARE   = re.compile(r"agravo em recurso extraordin|are\b")
 
 # Decisão final
 RE_INADMITIDO = re.compile(
-    r"\b(inadmit|n[ãa]o admito|n[ãa]o conhec|obst[ao]|deserto|intempestiv|prejudicad)",
-    re.I
+    r"\b(inadmit|n[ãa]o admito|n[ãa]o conhec|obst[ao]|deserto|intempestiv|prejudicad)"
 )
 RE_ADMITIDO = re.compile(
-    r"\b(admito|conhec[eo]|determino o processamento|remetam-se|remeta-se)\b",
-    re.I
+    r"\b(admito|conhec[eo]|determino o processamento|remetam-se|remeta-se)\b"
 )
 RE_DILIGENCIA = re.compile(
-    r"\b(dilig[eê]ncias|intime-se|intime a parte|providencie|comprove|comprova[çc][ãa]o)\b",
-    re.I
+    r"\b(dilig[eê]ncias|intime-se|intime a parte|providencie|comprove|comprova[çc][ãa]o)\b"
 )
 
 # Súmulas STJ/STF
 RE_SUMULA = re.compile(
-    r"s[úu]mula[s]?\s+n?[oº°]?\s*(\d+)(?:/([A-Z]+))?",
-    re.I
+    r"s[úu]mula[s]?\s+n?[oº°]?\s*(?P<numero>\d+)(?:/(?P<orgao>[a-z]+))?"
 )
 
 # Matérias comuns
@@ -75,6 +100,30 @@ MATERIAS_KEYWORDS: dict[str, list[str]] = {
     "execucao_fiscal":           ["execução fiscal", "certidão de dívida ativa", "cda", "fazenda"],
 }
 
+
+# Estruturas derivadas, montadas uma vez no import (cada worker do pool as
+# constrói uma única vez e as reutiliza para todos os PDFs).
+MATERIAS_ORDEM: tuple[str, ...] = tuple(MATERIAS_KEYWORDS)
+_MATERIAS_BUSCA: tuple[tuple[int, tuple[str, ...]], ...] = tuple(
+    (posicao, tuple(MATERIAS_KEYWORDS[materia]))
+    for posicao, materia in enumerate(MATERIAS_ORDEM)
+)
+
+
+def _construir_automato_materias():
+    """Monta um autômato Aho–Corasick palavra-chave → posição da matéria (None sem pyahocorasick)."""
+    if ahocorasick is None:
+        return None
+    automato = ahocorasick.Automaton()
+    for posicao, keywords in _MATERIAS_BUSCA:
+        for kw in keywords:
+            automato.add_word(kw, posicao)
+    automato.make_automaton()
+    return automato
+
+
+MATERIAS_AUTOMATO = _construir_automato_materias()
+
 # Número do processo
 RE_PROCESSO = re.compile(
     r"(\d{7}-\d{2}\.\d{4}\.\d{1,2}\.\d{2}\.\d{4})",
@@ -86,11 +135,105 @@ RE_CAMARA = re.compile(
     re.I
 )
 
+# Núcleo da câmara (sem a cauda descritiva) e cauda aplicada após o match
+RE_CAMARA_NUCLEO = r"\d+[aª°]?\s*(?:câmara|turma|seção)"
+RE_CAMARA_CAUDA  = re.compile(r"[^\n,]{0,40}")
+
+# Varredura única: todos os padrões acima numa só alternação nomeada, sem
+# lookarounds. A cauda da câmara ([^\n,]{0,40}) é lida depois do match para
+# não consumir trechos de outros grupos.
+_PADRAO_CLASSIFICACAO = "|".join([
+    rf"(?P<are>{RE_ARE.pattern})",
+    rf"(?P<aresp>{RE_ARESP.pattern})",
+    rf"(?P<re>{RE_RE.pattern})",
+    rf"(?P<resp>{RE_RESP.pattern})",
+    rf"(?P<diligencia>{RE_DILIGENCIA.pattern})",
+    rf"(?P<inadmitido>{RE_INADMITIDO.pattern})",
+    rf"(?P<admitido>{RE_ADMITIDO.pattern})",
+    rf"(?P<sumula>{RE_SUMULA.pattern})",
+    rf"(?P<processo>{RE_PROCESSO.pattern})",
+    rf"(?P<camara>{RE_CAMARA_NUCLEO})",
+])
+RE_CLASSIFICACAO = re.compile(_PADRAO_CLASSIFICACAO)
+
+
+def _compilar_candidatos_re2(padrao: str):
+    """
+    Compila a alternação no RE2 como localizador de candidatos.
+
+    No RE2, \\s, \\d e \\b são ASCII; \\s e \\d são ampliados para as classes
+    Unicode equivalentes às do ``re``. O \\b ASCII aceita um superconjunto das
+    posições do ``re``, então todo candidato é confirmado com RE_CLASSIFICACAO.
+    """
+    if re2 is None:
+        return None
+    padrao = padrao.replace(r"\s", r"[\s\x0b\x1c-\x1f\x85\p{Z}]").replace(r"\d", r"\p{Nd}")
+    try:
+        return re2.compile(padrao)
+    except re2.error:
+        return None
+
+
+RE_CLASSIFICACAO_RE2 = _compilar_candidatos_re2(_PADRAO_CLASSIFICACAO)
+
+
+def _iterar_matches(texto: str):
+    """Itera os matches de RE_CLASSIFICACAO, usando o RE2 para saltar o texto sem candidatos."""
+    if RE_CLASSIFICACAO_RE2 is None:
+        yield from RE_CLASSIFICACAO.finditer(texto)
+        return
+
+    pos = 0
+    while True:
+        candidato = RE_CLASSIFICACAO_RE2.search(texto, pos)
+        if candidato is None:
+            return
+        m = RE_CLASSIFICACAO.match(texto, candidato.start())
+        if m is None:
+            pos = candidato.start() + 1
+            continue
+        yield m
+        pos = m.end()
+
+
+# Tipo, decisão, processo e câmara aparecem no cabeçalho e no dispositivo:
+# a classificação só olha o início e o fim do texto (exceto com --full-scan).
+JANELA_INICIO_CHARS = 8192
+JANELA_FIM_CHARS    = 4096
+
+# Prioridades (primeiro da tupla vence)
+_PRIORIDADE_TIPO = (
+    ("are",   "agravo_recurso_extraordinario"),
+    ("aresp", "agravo_recurso_especial"),
+    ("re",    "recurso_extraordinario"),
+    ("resp",  "recurso_especial"),
+)
+# Diligência tem prioridade (ainda não é decisão final)
+_PRIORIDADE_DECISAO = (
+    ("diligencia", "diligencia"),
+    ("inadmitido", "inadmitido"),
+    ("admitido",   "admitido"),
+)
+
 
 # ── Funções de extração ──────────────────────────────────────────────────────
 
-def extrair_texto_pdf(pdf_path: Path) -> str:
-    """Extrai texto via pdftotext (mais rápido e confiável)."""
+def _extrair_texto_pymupdf(pdf_path: Path) -> tuple[str, bool]:
+    """Extrai texto em processo via PyMuPDF; indica se todas as páginas foram lidas."""
+    paginas: list[str] = []
+    completo = True
+    with fitz.open(pdf_path) as doc:
+        for page in doc:
+            try:
+                paginas.append(page.get_text())
+            except Exception:
+                paginas.append("")
+                completo = False
+    return "\n".join(paginas).strip(), completo
+
+
+def _extrair_texto_pdftotext(pdf_path: Path) -> str:
+    """Extrai texto via pdftotext (fallback quando PyMuPDF falha)."""
     try:
         result = subprocess.run(
             ["pdftotext", "-layout", str(pdf_path), "-"],
@@ -101,96 +244,250 @@ def extrair_texto_pdf(pdf_path: Path) -> str:
         return f"[ERRO AO EXTRAIR: {e}]"
 
 
+def extrair_texto_pdf(pdf_path: Path) -> str:
+    """Extrai texto em processo (PyMuPDF), sem um subprocesso por PDF.
+
+    Se alguma página falhar ou o texto vier vazio, usa o pdftotext.
+    """
+    texto_parcial = ""
+    if fitz is not None:
+        try:
+            texto, completo = _extrair_texto_pymupdf(pdf_path)
+            if completo and texto:
+                return texto
+            texto_parcial = texto
+        except Exception:
+            pass
+    texto = _extrair_texto_pdftotext(pdf_path)
+    if texto_parcial and (not texto or texto.startswith("[ERRO AO EXTRAIR")):
+        return texto_parcial
+    return texto
+
+
+def _rotulo_sumula(m: re.Match) -> str:
+    """Formata a súmula capturada como "7" ou "7/STJ"."""
+    num   = m.group("numero")
+    orgao = m.group("orgao") or ""
+    return f"{num}/{orgao.upper()}" if orgao else num
+
+
+def regiao_classificacao(texto: str) -> str:
+    """Recorta início + fim do texto, onde ficam cabeçalho e dispositivo."""
+    if len(texto) <= JANELA_INICIO_CHARS + JANELA_FIM_CHARS:
+        return texto
+    return texto[:JANELA_INICIO_CHARS] + "\n" + texto[-JANELA_FIM_CHARS:]
+
+
+def varrer_texto(texto: str, texto_lower: str | None = None) -> dict:
+    """
+    Percorre o texto uma única vez e extrai tipo, decisão, súmulas, processo e câmara.
+
+    ``texto_lower`` permite reaproveitar o ``texto.lower()`` já calculado pelo chamador.
+    """
+    if texto_lower is None:
+        texto_lower = texto.lower()
+    # lower() raramente muda o comprimento (ex.: "İ"); aí os spans não batem com o original
+    mesmo_comprimento = len(texto_lower) == len(texto)
+
+    grupos: set[str] = set()
+    sumulas: set[str] = set()
+    numero_processo = ""
+    camara = ""
+
+    for m in _iterar_matches(texto_lower):
+        grupo = m.lastgroup
+        if grupo == "sumula":
+            sumulas.add(_rotulo_sumula(m))
+        elif grupo == "processo":
+            numero_processo = numero_processo or m.group("processo")
+        elif grupo == "camara":
+            if not camara and mesmo_comprimento:
+                # Câmara é devolvida com a grafia original do texto
+                fim = RE_CAMARA_CAUDA.match(texto_lower, m.end()).end()
+                camara = texto[m.start():fim].strip()
+        else:
+            grupos.add(grupo)
+
+    if not camara and not mesmo_comprimento:
+        m = RE_CAMARA.search(texto)
+        camara = m.group(1).strip() if m else ""
+
+    return {
+        "tipo_recurso":    next((v for g, v in _PRIORIDADE_TIPO if g in grupos), "desconhecido"),
+        "decisao":         next((v for g, v in _PRIORIDADE_DECISAO if g in grupos), "desconhecido"),
+        "sumulas":         sorted(sumulas),
+        "numero_processo": numero_processo,
+        "camara":          camara,
+    }
+
+
 def detectar_tipo_recurso(texto: str) -> str:
     """Detecta tipo de recurso mencionado na decisão."""
-    if RE_ARE.search(texto):
-        return "agravo_recurso_extraordinario"
-    if RE_ARESP.search(texto):
-        return "agravo_recurso_especial"
-    if RE_RE.search(texto):
-        return "recurso_extraordinario"
-    if RE_RESP.search(texto):
-        return "recurso_especial"
-    return "desconhecido"
+    return varrer_texto(texto)["tipo_recurso"]
 
 
 def detectar_decisao(texto: str) -> str:
     """Detecta tipo de decisão: inadmitido, admitido, diligencia, desconhecido."""
-    # Diligência tem prioridade (ainda não é decisão final)
-    if RE_DILIGENCIA.search(texto):
-        return "diligencia"
-    if RE_INADMITIDO.search(texto):
-        return "inadmitido"
-    if RE_ADMITIDO.search(texto):
-        return "admitido"
-    return "desconhecido"
-
-
-def extrair_sumulas(texto: str) -> list[str]:
-    """Extrai todas as súmulas mencionadas."""
-    sumulas = set()
-    for m in RE_SUMULA.finditer(texto):
-        num    = m.group(1)
-        orgao  = m.group(2) or ""
-        label  = f"{num}/{orgao.upper()}" if orgao else num
-        sumulas.add(label)
-    return sorted(sumulas)
-
-
-def extrair_materias(texto: str) -> list[str]:
+    return varrer_texto(texto)["decisao"]
+
+
+def extrair_sumulas(texto: str, texto_lower: str | None = None) -> list[str]:
+    """
+    Extrai todas as súmulas mencionadas (em qualquer ponto do texto).
+
+    Em vez de ``finditer`` (que tenta o padrão em cada posição do texto), o
+    literal "mula" é localizado com ``str.find`` e o RE_SUMULA só é ancorado
+    nas poucas ocorrências precedidas de "sú"/"su".
+    """
+    if texto_lower is None:
+        texto_lower = texto.lower()
+
+    rotulos: set[str] = set()
+    fim = 0
+    pos = texto_lower.find("mula", 2)
+    while pos != -1:
+        inicio = pos - 2
+        if inicio >= fim and texto_lower[inicio] == "s" and texto_lower[inicio + 1] in "úu":
+            m = RE_SUMULA.match(texto_lower, inicio)
+            if m:
+                rotulos.add(_rotulo_sumula(m))
+                fim = m.end()
+        pos = texto_lower.find("mula", pos + 4)
+    return sorted(rotulos)
+
+
+def extrair_materias(texto: str, texto_lower: str | None = None) -> list[str]:
     """Detecta matérias baseado em palavras-chave."""
-    texto_lower = texto.lower()
-    encontradas = []
-    for materia, keywords in MATERIAS_KEYWORDS.items():
-        if any(kw in texto_lower for kw in keywords):
-            encontradas.append(materia)
-    return encontradas
+    if texto_lower is None:
+        texto_lower = texto.lower()
+
+    if MATERIAS_AUTOMATO is None:
+        achadas = {
+            posicao for posicao, keywords in _MATERIAS_BUSCA
+            if any(kw in texto_lower for kw in keywords)
+        }
+    else:
+        achadas = set()
+        for _, posicao in MATERIAS_AUTOMATO.iter(texto_lower):
+            achadas.add(posicao)
+            if len(achadas) == len(MATERIAS_ORDEM):
+                break
+    # Mantém a ordem de MATERIAS_KEYWORDS
+    return [MATERIAS_ORDEM[posicao] for posicao in sorted(achadas)]
 
 
 def extrair_numero_processo(texto: str) -> str:
     """Extrai número do processo no formato CNJ."""
-    m = RE_PROCESSO.search(texto)
-    return m.group(1) if m else ""
+    return varrer_texto(texto)["numero_processo"]
 
 
 def extrair_camara(texto: str) -> str:
     """Extrai câmara/turma/seção julgadora."""
-    m = RE_CAMARA.search(texto)
-    return m.group(1).strip() if m else ""
-
-
-def processar_pdf(pdf_path: Path, textos_dir: Path) -> dict:
-    """Processa um PDF e retorna os metadados extraídos."""
+    return varrer_texto(texto)["camara"]
+
+
+def hash_pdf(pdf_path: Path) -> str:
+    """Hash SHA-256 (16 hex) do conteúdo do PDF, usado para pular arquivos inalterados."""
+    with pdf_path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()[:16]
+
+
+def ler_texto_salvo(txt_path: Path) -> str:
+    """
+    Lê o .txt reaproveitado via mmap, decodificando direto das páginas mapeadas.
+
+    Evita a cópia intermediária em ``bytes`` do ``read_text`` (menor pico de
+    RSS por worker). Mantém a tradução de quebras de linha do modo texto.
+    """
+    with open(txt_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            texto = str(mm, "utf-8")
+            if mm.find(b"\r") != -1:
+                texto = texto.replace("\r\n", "\n").replace("\r", "\n")
+    return texto
+
+
+def processar_pdf(
+    pdf_path: Path,
+    textos_dir: Path,
+    full_scan: bool = False,
+    pdf_hash: str | None = None,
+    reextrair: bool = False,
+) -> dict:
+    """
+    Processa um PDF e retorna os metadados extraídos.
+
+    Sem ``full_scan``, tipo/decisão/processo/câmara vêm de regiao_classificacao();
+    súmulas e matérias sempre usam o texto inteiro (aparecem na fundamentação).
+    ``reextrair`` ignora o .txt salvo (ex.: PDF substituído com o mesmo nome).
+    """
     txt_path = textos_dir / (pdf_path.stem + ".txt")
 
     # Reusar texto já extraído
-    if txt_path.exists():
-        texto = txt_path.read_text(encoding="utf-8")
+    if txt_path.exists() and not reextrair:
+        texto = ler_texto_salvo(txt_path)
     else:
         texto = extrair_texto_pdf(pdf_path)
         txt_path.write_text(texto, encoding="utf-8")
 
+    texto_lower = texto.lower()
+    if full_scan:
+        extraido = varrer_texto(texto, texto_lower)
+    else:
+        extraido = varrer_texto(regiao_classificacao(texto))
+        extraido["sumulas"] = extrair_sumulas(texto, texto_lower)
+
     return {
         "id":              pdf_path.stem,
         "arquivo":         pdf_path.name,
-        "tipo_recurso":    detectar_tipo_recurso(texto),
-        "decisao":         detectar_decisao(texto),
-        "sumulas":         extrair_sumulas(texto),
-        "materias":        extrair_materias(texto),
-        "numero_processo": extrair_numero_processo(texto),
-        "camara":          extrair_camara(texto),
+        "pdf_hash":        pdf_hash or hash_pdf(pdf_path),
+        "tipo_recurso":    extraido["tipo_recurso"],
+        "decisao":         extraido["decisao"],
+        "sumulas":         extraido["sumulas"],
+        "materias":        extrair_materias(texto, texto_lower),
+        "numero_processo": extraido["numero_processo"],
+        "camara":          extraido["camara"],
         "chars":           len(texto),
         "importado_em":    datetime.now().isoformat(),
         "avaliacao":       "pendente",  # será atualizado via feedback
     }
 
 
+def importar_pdf(
+    pdf_path: Path,
+    textos_dir: Path,
+    full_scan: bool = False,
+    hash_antigo: str = "",
+    reaproveitar: bool = True,
+) -> dict | None:
+    """
+    Worker da importação: calcula o hash e processa o PDF se ele mudou.
+
+    Retorna None quando o conteúdo é igual ao ``hash_antigo`` (índice anterior)
+    e ``reaproveitar`` é verdadeiro; o chamador mantém então os metadados antigos.
+    """
+    pdf_hash = hash_pdf(pdf_path)
+    if reaproveitar and hash_antigo == pdf_hash:
+        return None
+    return processar_pdf(
+        pdf_path,
+        textos_dir,
+        full_scan,
+        pdf_hash,
+        reextrair=bool(hash_antigo) and hash_antigo != pdf_hash,
+    )
+
+
 # ── Main ─────────────────────────────────────────────────────────────────────
 
 def main():
     parser = argparse.ArgumentParser(description="Importa minutas de referência dos PDFs")
     parser.add_argument("--limite",      type=int, default=0,     help="Processar somente N arquivos (0 = todos)")
     parser.add_argument("--reprocessar", action="store_true",     help="Forçar reprocessamento mesmo se já existir texto")
+    parser.add_argument("--workers",     type=int, default=0,     help="Processos paralelos (0 = número de CPUs)")
+    parser.add_argument("--full-scan",   action="store_true",     help="Classificar pelo texto inteiro, não só início/fim (auditoria)")
     args = parser.parse_args()
 
     TEXTOS_DIR.mkdir(parents=True, exist_ok=True)
@@ -217,39 +514,72 @@ def main():
         except Exception:
             pass
 
-    resultados: list[dict] = []
     erros: list[str] = []
-
-    for i, pdf in enumerate(pdfs, 1):
-        print(f"[{i:3d}/{len(pdfs)}] {pdf.name}", end=" ... ", flush=True)
-        try:
-            meta = processar_pdf(pdf, TEXTOS_DIR)
-
-            # Preservar avaliação humana se já existir
-            if meta["id"] in existente:
-                antigo = existente[meta["id"]]
-                meta["avaliacao"]       = antigo.get("avaliacao", "pendente")
-                meta["notas_revisao"]   = antigo.get("notas_revisao", "")
-                meta["assessor_revisor"]= antigo.get("assessor_revisor", "")
-
-            resultados.append(meta)
-            print(f"✅ {meta['tipo_recurso']} | {meta['decisao']} | súmulas={meta['sumulas']}")
-        except Exception as e:
-            erros.append(f"{pdf.name}: {e}")
-            print(f"❌ ERRO: {e}")
-
-    # Salvar índice
-    INDEX_FILE.write_text(
-        json.dumps(resultados, ensure_ascii=False, indent=2),
-        encoding="utf-8"
-    )
+    workers = args.workers or os.cpu_count() or 1
+
+    # PDFs com o mesmo conteúdo da última importação reaproveitam os metadados;
+    # o hash é calculado no worker, dentro do tratamento de erro por PDF.
+    por_posicao: dict[int, dict] = {}
+    reaproveitar = not (args.reprocessar or args.full_scan)
+    inalterados = 0
+
+    # Cada PDF é independente (hash + extração + regex + IO): distribuir entre processos
+    with ProcessPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {}
+        for i, pdf in enumerate(pdfs, 1):
+            antigo = existente.get(pdf.stem)
+            hash_antigo = antigo.get("pdf_hash", "") if antigo else ""
+            future = executor.submit(
+                importar_pdf, pdf, TEXTOS_DIR, args.full_scan, hash_antigo, reaproveitar
+            )
+            futures[future] = (i, pdf)
+        for concluidos, future in enumerate(as_completed(futures), 1):
+            i, pdf = futures[future]
+            print(f"[{concluidos:3d}/{len(pdfs)}] {pdf.name}", end=" ... ", flush=True)
+            try:
+                meta = future.result()
+                if meta is None:
+                    por_posicao[i] = existente[pdf.stem]
+                    inalterados += 1
+                    print("♻️  inalterado")
+                    continue
+
+                # Preservar avaliação humana se já existir
+                if meta["id"] in existente:
+                    antigo = existente[meta["id"]]
+                    meta["avaliacao"]       = antigo.get("avaliacao", "pendente")
+                    meta["notas_revisao"]   = antigo.get("notas_revisao", "")
+                    meta["assessor_revisor"]= antigo.get("assessor_revisor", "")
+
+                por_posicao[i] = meta
+                print(f"✅ {meta['tipo_recurso']} | {meta['decisao']} | súmulas={meta['sumulas']}")
+            except Exception as e:
+                erros.append(f"{pdf.name}: {e}")
+                print(f"❌ ERRO: {e}")
+
+    if inalterados:
+        print(f"♻️  {inalterados} PDF(s) inalterado(s) desde a última importação")
+
+    # Manter a ordem do índice estável (ordem alfabética dos PDFs)
+    resultados = [por_posicao[i] for i in sorted(por_posicao)]
+
+    # Salvar índice (JSON indentado: é versionado e revisado manualmente)
+    if orjson is not None:
+        INDEX_FILE.write_bytes(orjson.dumps(resultados, option=orjson.OPT_INDENT_2))
+    else:
+        INDEX_FILE.write_text(
+            json.dumps(resultados, ensure_ascii=False, indent=2),
+            encoding="utf-8"
+        )
 
     # Relatório
     total      = len(resultados)
-    inadmitidos= sum(1 for r in resultados if r["decisao"] == "inadmitido")
-    admitidos  = sum(1 for r in resultados if r["decisao"] == "admitido")
-    diligencias= sum(1 for r in resultados if r["decisao"] == "diligencia")
-    desconhec  = sum(1 for r in resultados if r["decisao"] == "desconhecido")
+    decisoes   = Counter(r["decisao"] for r in resultados)
+    tipos      = Counter(r["tipo_recurso"] for r in resultados)
+    inadmitidos= decisoes["inadmitido"]
+    admitidos  = decisoes["admitido"]
+    diligencias= decisoes["diligencia"]
+    desconhec  = decisoes["desconhecido"]
 
     print("\n" + "="*60)
     print(f"✅ Importação concluída: {total} minutas")
@@ -257,6 +587,9 @@ def main():
     print(f"   Admitidos    : {admitidos}")
     print(f"   Diligências  : {diligencias}")
     print(f"   Desconhecidos: {desconhec}")
+    print("   Por tipo de recurso:")
+    for tipo, qtd in tipos.most_common():
+        print(f"     {tipo:<30}: {qtd}")
     if erros:
         print(f"\n⚠️  {len(erros)} erros:")
         for e in erros:
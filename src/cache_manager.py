@@ -1,19 +1,56 @@
 """Cache management: file-based cache with TTL for LLM responses."""
 
 import base64
+import copy
 import hashlib
 import json
 import logging
+import os
 import re
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None
+
 from src.config import CACHE_ENCRYPTION_KEY, CACHE_TTL_SECONDS, OUTPUTS_DIR
 from src.crypto_utils import decrypt_text, encrypt_text, generate_key
 
 logger = logging.getLogger("assessor_ai")
 
+# get_stats(): stat() releases the GIL, so large caches on network/slow storage
+# are stat'ed by a small thread pool; small caches stay serial (no pool overhead).
+STATS_PARALLEL_MIN_FILES: int = 256
+STATS_MAX_WORKERS: int = 16
+
+# set() writes through "<entry>.json.<pid>.<thread>.tmp" files; ones older than
+# this were left by a crashed writer (a live write takes milliseconds).
+TMP_ORPHAN_MAX_AGE_SECONDS: int = 300
+
+
+def _dump_json_bytes(value: Any) -> bytes:
+    """Serialize a cache envelope as compact JSON (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _load_json(data: bytes | str) -> Any:
+    """Parse JSON with orjson when available, falling back to stdlib for non-strict input."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity or >64-bit ints emitted by json.dumps
+    return json.loads(data)
+
 
 class CacheManager:
     """
@@ -32,6 +69,7 @@ class CacheManager:
         ttl_seconds: int | None = None,
         ttl_hours: float | None = None,
         encryption_key: str | None = None,
+        max_memory_entries: int = 256,
     ):
         """
         Initialize cache manager.
@@ -40,6 +78,7 @@ class CacheManager:
             cache_dir: Directory for cache storage (default: outputs/.cache).
             ttl_seconds: Cache TTL in seconds (default: from config).
             ttl_hours: Legacy cache TTL in hours (deprecated; backward compatible).
+            max_memory_entries: Size of the in-process LRU of decoded entries (0 disables).
         """
         self.cache_dir = cache_dir or (OUTPUTS_DIR / ".cache")
         effective_ttl_seconds = ttl_seconds
@@ -56,6 +95,14 @@ class CacheManager:
             self.encryption_key = generate_key()
             self.uses_ephemeral_key = True
 
+        # In-process LRU: (category, key) -> (file mtime_ns, created_at, payload).
+        # A hit still stats the file, so external changes/expiry are honored,
+        # but skips open + JSON parse + decryption.
+        self.max_memory_entries = max(0, int(max_memory_entries))
+        self._memory: OrderedDict[tuple[str, str], tuple[int, float, Any]] = OrderedDict()
+        # get/set run from classifier and etapa2 worker threads.
+        self._memory_lock = threading.Lock()
+
         # Create cache directory
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
@@ -85,7 +132,8 @@ class CacheManager:
         """
         # Use first 1000 chars for hashing (enough to distinguish prompts)
         sample = text[:1000]
-        return hashlib.sha256(sample.encode("utf-8")).hexdigest()[:16]
+        # Slice raw digest bytes instead of formatting 64 hex chars to keep 16.
+        return hashlib.sha256(sample.encode("utf-8")).digest()[:8].hex()
 
     def _normalize_for_hash(self, value: Any) -> Any:
         """Normalize values to deterministic JSON-compatible representation."""
@@ -106,11 +154,31 @@ class CacheManager:
             return value
         return str(value)
 
+    def _is_canonical_json(self, value: Any) -> bool:
+        """Check whether json.dumps(sort_keys=True) already yields the normalized form."""
+        # Exact str only: str subclasses (e.g. str-based Enum) stringify differently
+        # as keys under str(k), so they go through the normalizer.
+        if type(value) is str or isinstance(value, (int, float, bool)) or value is None:
+            return True
+        if isinstance(value, dict):
+            return all(
+                type(k) is str and self._is_canonical_json(v)
+                for k, v in value.items()
+            )
+        if isinstance(value, (list, tuple)):
+            return all(self._is_canonical_json(v) for v in value)
+        return False
+
     def hash_payload(self, payload: Any) -> str:
         """Hash arbitrary payload deterministically using canonical JSON."""
-        normalized = self._normalize_for_hash(payload)
+        # Plain strings and str-keyed JSON trees skip the copying normalizer;
+        # the serialized bytes (and therefore the keys) are identical.
+        if self._is_canonical_json(payload):
+            normalized = payload
+        else:
+            normalized = self._normalize_for_hash(payload)
         serialized = json.dumps(normalized, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
-        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()[:32]
+        return hashlib.sha256(serialized.encode("utf-8")).digest()[:16].hex()
 
     def _slug(self, value: str, default: str) -> str:
         """Sanitize category segment for filesystem paths."""
@@ -174,9 +242,46 @@ class CacheManager:
         category_dir.mkdir(parents=True, exist_ok=True)
         return category_dir / f"{key}.json"
 
-    def _unwrap_cached_entry(self, cached_data: Any, cache_file: Path) -> tuple[Any, float, bool]:
+    def _iter_cache_files(
+        self, root: Path | None = None, suffix: str = ".json"
+    ) -> Iterator[os.DirEntry]:
+        """Yield cache entry files under root using os.scandir (no Path/stat per entry)."""
+        stack = [os.fspath(root or self.cache_dir)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith(suffix) and entry.is_file():
+                            yield entry
+            except FileNotFoundError:
+                continue
+
+    def _purge_orphan_tmp_files(self, root: Path | None = None) -> int:
+        """Delete temp files left behind by interrupted set() calls."""
+        cutoff = time.time() - TMP_ORPHAN_MAX_AGE_SECONDS
+        deleted = 0
+        for entry in list(self._iter_cache_files(root, suffix=".tmp")):
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+                    deleted += 1
+            except FileNotFoundError:
+                continue
+        if deleted:
+            logger.debug("Cache: %d orphan temp files deleted", deleted)
+        return deleted
+
+    def _unwrap_cached_entry(
+        self,
+        cached_data: Any,
+        cache_file: Path,
+        stat_mtime: float | None = None,
+    ) -> tuple[Any, float, bool]:
         """Return payload, creation timestamp and whether entry is legacy plaintext."""
-        stat_mtime = cache_file.stat().st_mtime
+        if stat_mtime is None:
+            stat_mtime = cache_file.stat().st_mtime
         created_at = stat_mtime
         payload = cached_data
         is_legacy_plaintext = False
@@ -199,7 +304,7 @@ class CacheManager:
                 except Exception as exc:
                     raise ValueError("Falha ao decodificar payload criptografado de cache.") from exc
                 payload_text = decrypt_text(blob, self.encryption_key)
-                payload = json.loads(payload_text)
+                payload = _load_json(payload_text)
                 return payload, created_at, False
 
             if "payload" in cached_data:
@@ -228,19 +333,43 @@ class CacheManager:
             Cached value or None if not found/expired.
         """
         cache_file = self._get_cache_path(key, category)
+        memory_key = (category, key)
 
-        if not cache_file.exists():
+        try:
+            file_stat = cache_file.stat()
+        except OSError:
+            self._forget(memory_key)
             logger.debug("Cache miss: key=%s, category=%s", key, category)
             return None
 
+        mtime_ns = file_stat.st_mtime_ns
+        with self._memory_lock:
+            memorized = self._memory.get(memory_key)
+            if memorized is not None and memorized[0] == mtime_ns:
+                expired = self._is_entry_expired(memorized[1])
+                if expired:
+                    del self._memory[memory_key]
+                else:
+                    self._memory.move_to_end(memory_key)
+            else:
+                memorized = None
+        if memorized is not None:
+            _, created_at, payload = memorized
+            if expired:
+                logger.debug("Cache expired: key=%s, category=%s", key, category)
+                cache_file.unlink(missing_ok=True)
+                return None
+            logger.debug("Cache hit (memory): key=%s, category=%s", key, category)
+            return copy.deepcopy(payload)
+
         # Read cached value
         try:
-            with cache_file.open("r", encoding="utf-8") as f:
-                cached_data = json.load(f)
+            cached_data = _load_json(cache_file.read_bytes())
 
             payload, created_at, is_legacy_plaintext = self._unwrap_cached_entry(
                 cached_data,
                 cache_file,
+                stat_mtime=file_stat.st_mtime,
             )
             if is_legacy_plaintext:
                 logger.warning(
@@ -262,14 +391,34 @@ class CacheManager:
                 "Cache hit: key=%s, category=%s, age=%.1fh",
                 key, category, age_seconds / 3600,
             )
-            return payload
+            self._remember(memory_key, mtime_ns, created_at, payload)
+            return copy.deepcopy(payload)
 
         except (json.JSONDecodeError, ValueError, OSError) as e:
             logger.warning("Failed to read cache file %s: %s", cache_file, e)
             # Delete corrupted cache
+            self._forget(memory_key)
             cache_file.unlink(missing_ok=True)
             return None
 
+    def _remember(self, memory_key: tuple[str, str], mtime_ns: int, created_at: float, payload: Any) -> None:
+        """Store decoded entry in the in-process LRU, evicting the least recent one."""
+        if self.max_memory_entries <= 0:
+            return
+        with self._memory_lock:
+            self._memory[memory_key] = (mtime_ns, created_at, payload)
+            self._memory.move_to_end(memory_key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    def _forget(self, memory_key: tuple[str, str] | None = None) -> None:
+        """Drop one entry (or every entry when memory_key is None) from the in-process LRU."""
+        with self._memory_lock:
+            if memory_key is None:
+                self._memory.clear()
+            else:
+                self._memory.pop(memory_key, None)
+
     def set(self, key: str, value: Any, category: str = "general") -> None:
         """
         Store value in cache.
@@ -283,18 +432,37 @@ class CacheManager:
 
         try:
             payload_text = json.dumps(value, ensure_ascii=False, default=str)
+            created_at = time.time()
             encrypted_blob = encrypt_text(payload_text, self.encryption_key)
             envelope = {
                 "_cache_meta": {
-                    "created_at": time.time(),
+                    "created_at": created_at,
                     "ttl_seconds": self.ttl_seconds,
                     "encrypted": True,
                     "key_mode": "ephemeral" if self.uses_ephemeral_key else "configured",
                 },
                 "payload_encrypted": base64.urlsafe_b64encode(encrypted_blob).decode("ascii"),
             }
-            with cache_file.open("w", encoding="utf-8") as f:
-                json.dump(envelope, f, indent=2, ensure_ascii=False, default=str)
+            # Write to a sibling temp file and rename: readers see the old entry
+            # or the new one, never a truncated file (e.g. Ctrl-C mid-write).
+            tmp_file = cache_file.with_name(
+                f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            try:
+                tmp_file.write_bytes(_dump_json_bytes(envelope))
+                os.replace(tmp_file, cache_file)
+            except BaseException:
+                tmp_file.unlink(missing_ok=True)
+                raise
+
+            # Memorize what get() would decode from disk (JSON round-trip of value)
+            file_stat = cache_file.stat()
+            self._remember(
+                (category, key),
+                file_stat.st_mtime_ns,
+                min(created_at, file_stat.st_mtime),
+                _load_json(payload_text),
+            )
 
             logger.debug("Cache stored: key=%s, category=%s", key, category)
 
@@ -313,6 +481,7 @@ class CacheManager:
             True if file was deleted, False if not found.
         """
         cache_file = self._get_cache_path(key, category)
+        self._forget((category, key))
 
         if cache_file.exists():
             cache_file.unlink()
@@ -331,23 +500,26 @@ class CacheManager:
         Returns:
             Number of files deleted.
         """
+        self._forget()
         if category:
             category_dir = self.cache_dir / category
             if not category_dir.exists():
                 return 0
 
-            files = list(category_dir.rglob("*.json"))
-            for f in files:
-                f.unlink()
+            files = [entry.path for entry in self._iter_cache_files(category_dir)]
+            for path in files:
+                os.unlink(path)
+            self._purge_orphan_tmp_files(category_dir)
 
             logger.info("Cache cleared: category=%s, files=%d", category, len(files))
             return len(files)
 
         else:
             # Clear all categories
-            files = list(self.cache_dir.rglob("*.json"))
-            for f in files:
-                f.unlink()
+            files = [entry.path for entry in self._iter_cache_files()]
+            for path in files:
+                os.unlink(path)
+            self._purge_orphan_tmp_files()
             total = len(files)
 
             logger.info("Cache cleared: all categories, files=%d", total)
@@ -362,14 +534,16 @@ class CacheManager:
         """
         deleted = 0
         current_time = time.time()
+        self._forget()
 
-        for cache_file in self.cache_dir.rglob("*.json"):
+        for entry in list(self._iter_cache_files()):
+            cache_file = Path(entry.path)
             try:
-                with cache_file.open("r", encoding="utf-8") as f:
-                    cached_data = json.load(f)
+                cached_data = _load_json(cache_file.read_bytes())
                 _, created_at, is_legacy_plaintext = self._unwrap_cached_entry(
                     cached_data,
                     cache_file,
+                    stat_mtime=entry.stat().st_mtime,
                 )
                 if is_legacy_plaintext or self._is_entry_expired(
                     created_at,
@@ -381,6 +555,7 @@ class CacheManager:
                 cache_file.unlink(missing_ok=True)
                 deleted += 1
 
+        self._purge_orphan_tmp_files()
         if deleted > 0:
             logger.info("Cache purge: %d expired/corrupted entries deleted", deleted)
 
@@ -402,12 +577,19 @@ class CacheManager:
         categories: dict[str, int] = {}
         oldest_timestamp = time.time()
 
-        files = list(self.cache_dir.rglob("*.json"))
-        total_files = len(files)
-        for f in files:
-            total_size += f.stat().st_size
-            oldest_timestamp = min(oldest_timestamp, f.stat().st_mtime)
-            category_name = str(f.parent.relative_to(self.cache_dir))
+        cache_root = os.fspath(self.cache_dir)
+        entries = list(self._iter_cache_files())
+        if len(entries) >= STATS_PARALLEL_MIN_FILES:
+            with ThreadPoolExecutor(max_workers=STATS_MAX_WORKERS) as executor:
+                entry_stats = list(executor.map(os.DirEntry.stat, entries))
+        else:
+            entry_stats = [entry.stat() for entry in entries]
+
+        for entry, entry_stat in zip(entries, entry_stats):
+            total_files += 1
+            total_size += entry_stat.st_size
+            oldest_timestamp = min(oldest_timestamp, entry_stat.st_mtime)
+            category_name = os.path.relpath(os.path.dirname(entry.path), cache_root)
             categories[category_name] = categories.get(category_name, 0) + 1
 
         oldest_age_hours = (time.time() - oldest_timestamp) / 3600 if total_files > 0 else 0
@@ -421,5 +603,25 @@ class CacheManager:
         }
 
 
-# Global cache manager instance
-cache_manager = CacheManager()
+# Global cache manager instance — created on first use so importing this module
+# does not touch the filesystem (mkdir) or warn about the ephemeral key.
+_CACHE_MANAGER: CacheManager | None = None
+_CACHE_MANAGER_LOCK = threading.Lock()
+
+
+def get_cache_manager() -> CacheManager:
+    """Return the process-wide CacheManager (lazy, singleton, thread-safe)."""
+    global _CACHE_MANAGER
+    if _CACHE_MANAGER is not None:
+        return _CACHE_MANAGER
+    with _CACHE_MANAGER_LOCK:
+        if _CACHE_MANAGER is None:
+            _CACHE_MANAGER = CacheManager()
+    return _CACHE_MANAGER
+
+
+def __getattr__(name: str) -> Any:
+    """Keep `from src.cache_manager import cache_manager` working (PEP 562)."""
+    if name == "cache_manager":
+        return get_cache_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
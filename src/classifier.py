@@ -1,8 +1,28 @@
 """Document classification: heuristic-first, LLM fallback."""
 
+import copy
+import hashlib
 import logging
+import math
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import groupby
+from types import ModuleType
+from typing import Any, Callable
+
+try:
+    import re2  # google-re2: RE2::Set scans a whole pattern list in one DFA pass
+except ImportError:  # pragma: no cover - fallback to the literal prefilter / alternation scan
+    re2 = None
+
+try:
+    import ahocorasick  # pyahocorasick: literal prefilter when RE2 is not installed
+except ImportError:  # pragma: no cover - fallback to the stdlib alternation scan
+    ahocorasick = None
 
 from src.models import ClassificationAudit, DocumentoEntrada, TipoDocumento
 
@@ -57,6 +77,271 @@ CHEAP_VERIFIER_ACORDAO_PATTERNS: list[str] = [
     r"c[aâ]mara\s+c[ií]vel",
 ]
 
+# Share of a pattern list that must match for a heuristic score of 1.0
+HEURISTIC_SATURATION_RATIO: float = 0.2
+
+# Casefolded literals, at least one of which occurs in every match of the pattern.
+# Literals avoid "i": re.IGNORECASE matches it against İ, whose casefold is two chars.
+LITERAIS_PADROES: dict[str, tuple[str, ...]] = {
+    r"PROJUDI\s*[-–—]\s*Recurso": ("recurso",),
+    r"Recurso\s+Especial": ("recurso",),
+    r"Recurso\s+Extraordin[aá]rio": ("recurso",),
+    r"Agravo\s+(?:em\s+Recurso\s+Especial|Regimental|Interno)": ("agravo",),
+    r"AREsp\b": ("aresp",),
+    r"Embargos?\s+de\s+Declara(?:[çc][aã]o)": ("embargo",),
+    r"recurso\s+de\s+revista": ("recurso",),
+    r"raz[oõ]es\s+recursais": ("recursa",),
+    r"art\.\s*105\s*,\s*III": ("105",),
+    r"art\.\s*102\s*,\s*III": ("102",),
+    r"interposi[cç][aã]o\s+de\s+recurso": ("nterpos",),
+    r"petição\s+de\s+recurso": ("recurso",),
+    r"AC[OÓ]RD[AÃ]O": ("acord", "acórd"),
+    r"Vistos\s*,\s*relatados\s+e\s+discutidos": ("relatados",),
+    r"C[aâ]mara\s+C[ií]vel": ("mara",),
+    r"EMENTA": ("ementa",),
+    r"ACORDAM": ("acordam",),
+    r"Rel(?:ator|atora)\s*:": ("relator",),
+    r"TRIBUNAL\s+DE\s+JUSTI[CÇ]A": ("bunal",),
+    r"recurso\s+especial": ("recurso",),
+    r"recurso\s+extraordin[aá]rio": ("recurso",),
+    r"agravo\s+(?:em\s+recurso|regimental|interno)": ("agravo",),
+    r"aresp\b": ("aresp",),
+    r"art\.\s*105\s*,\s*iii": ("105",),
+    r"art\.\s*102\s*,\s*iii": ("102",),
+    r"ac[óo]rd[aã]o": ("acord", "acórd"),
+    r"ementa": ("ementa",),
+    r"acordam": ("acordam",),
+    r"vistos\s*,\s*relatados": ("relatados",),
+    r"c[aâ]mara\s+c[ií]vel": ("mara",),
+}
+
+
+@lru_cache(maxsize=None)
+def _compilar_padroes(patterns: tuple[str, ...]) -> tuple[re.Pattern[str], ...]:
+    """Compile a pattern list once (case-insensitive), keyed by its contents."""
+    return tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
+
+
+@dataclass(frozen=True)
+class _ConjuntoPadroes:
+    """
+    Pattern list compiled individually and as one named-group alternation.
+
+    The lists are fixed at import, so the bound ``search``/``match`` methods
+    are resolved once here instead of per pattern on every scan.
+    """
+
+    patterns: tuple[str, ...]
+    compilados: tuple[re.Pattern[str], ...]
+    buscas: tuple[Callable[..., re.Match[str] | None], ...]
+    ancoradas: tuple[Callable[..., re.Match[str] | None], ...]
+    alternacao: re.Pattern[str]
+    indice_por_grupo: dict[int, int]
+    rivais: tuple[tuple[int, ...], ...]
+    saturacao: int
+    conjunto_re2: Any = None
+    automato_literais: Any = None
+    sem_literal: tuple[int, ...] = ()
+
+
+def _literal_inicial(pattern: str) -> str | None:
+    """Return the mandatory leading literal of a pattern, or None if it has none."""
+    if not pattern[:1].isalnum() or pattern[1:2] in ("?", "*", "{"):
+        return None
+    profundidade = 0
+    em_classe = escape = False
+    for ch in pattern:
+        if escape:
+            escape = False
+        elif ch == "\\":
+            escape = True
+        elif em_classe:
+            em_classe = ch != "]"
+        elif ch == "[":
+            em_classe = True
+        elif ch == "(":
+            profundidade += 1
+        elif ch == ")":
+            profundidade -= 1
+        elif ch == "|" and profundidade == 0:
+            return None
+    return pattern[0]
+
+
+# RE2 equivalents for escapes/letters whose ``re`` (Unicode, IGNORECASE) meaning is wider.
+_EQUIVALENTES_RE2: dict[str, str] = {
+    "\\s": r"\s\x0b\x1c-\x1f\x85\p{Z}",
+    "\\d": r"\p{Nd}",
+    "i": "iIİı",
+    "I": "iIİı",
+}
+
+
+def _padrao_re2(pattern: str) -> str:
+    """
+    Translate a case-insensitive ``re`` pattern into an RE2 candidate pattern.
+
+    RE2's \\s and \\d are ASCII and its case folding does not pair i/I with
+    İ/ı as ``re`` does, so those are widened; RE2's ASCII \\b accepts a
+    superset of ``re``'s positions. Candidates must be confirmed with ``re``.
+    """
+    partes: list[str] = []
+    em_classe = escape = False
+    for ch in pattern:
+        token = "\\" + ch if escape else ch
+        if ch == "\\" and not escape:
+            escape = True
+            continue
+        escape = False
+        equivalente = _EQUIVALENTES_RE2.get(token)
+        if equivalente is not None:
+            partes.append(equivalente if em_classe else f"[{equivalente}]")
+            continue
+        if em_classe:
+            em_classe = token != "]"
+        elif token == "[":
+            em_classe = True
+        partes.append(token)
+    return "(?i)" + "".join(partes)
+
+
+def _compilar_set_re2(patterns: tuple[str, ...]) -> Any:
+    """Compile the pattern list as an RE2::Set, or None if RE2 is unavailable."""
+    if re2 is None or not patterns:
+        return None
+    conjunto = re2.Set.SearchSet()
+    try:
+        for pattern in patterns:
+            conjunto.Add(_padrao_re2(pattern))
+        conjunto.Compile()
+    except re2.error:
+        return None
+    return conjunto
+
+
+def _construir_automato_literais(patterns: tuple[str, ...]) -> Any:
+    """Build an Aho-Corasick automaton literal -> pattern indices (None without pyahocorasick)."""
+    if ahocorasick is None:
+        return None
+    indices_por_literal: dict[str, list[int]] = {}
+    for indice, pattern in enumerate(patterns):
+        for literal in LITERAIS_PADROES.get(pattern, ()):
+            indices_por_literal.setdefault(literal, []).append(indice)
+    if not indices_por_literal:
+        return None
+    automato = ahocorasick.Automaton()
+    for literal, indices in indices_por_literal.items():
+        automato.add_word(literal, tuple(indices))
+    automato.make_automaton()
+    return automato
+
+
+@lru_cache(maxsize=None)
+def _compilar_conjunto(patterns: tuple[str, ...]) -> _ConjuntoPadroes:
+    """
+    Build the single-scan alternation for a pattern list.
+
+    When every pattern starts with a literal, a lookahead on those first
+    characters lets ``re`` skip non-candidate positions with its charset scan,
+    and only patterns sharing an initial can match at the same position.
+    """
+    corpo = "|".join(f"(?P<p{i}>{pattern})" for i, pattern in enumerate(patterns))
+    iniciais = [_literal_inicial(pattern) for pattern in patterns]
+    if patterns and all(iniciais):
+        corpo = f"(?=[{re.escape(''.join(sorted(set(iniciais))))}])(?:{corpo})"
+        chaves = [inicial.lower() for inicial in iniciais]
+    else:
+        chaves = [""] * len(patterns)
+    alternacao = re.compile(corpo, re.IGNORECASE)
+    compilados = _compilar_padroes(patterns)
+    return _ConjuntoPadroes(
+        patterns=patterns,
+        compilados=compilados,
+        buscas=tuple(compilado.search for compilado in compilados),
+        ancoradas=tuple(compilado.match for compilado in compilados),
+        alternacao=alternacao,
+        indice_por_grupo={
+            alternacao.groupindex[f"p{i}"]: i for i in range(len(patterns))
+        },
+        rivais=tuple(
+            tuple(j for j, outra in enumerate(chaves) if j != i and outra == chave)
+            for i, chave in enumerate(chaves)
+        ),
+        saturacao=math.ceil(max(len(patterns) * HEURISTIC_SATURATION_RATIO, 1)),
+        conjunto_re2=_compilar_set_re2(patterns),
+        automato_literais=_construir_automato_literais(patterns),
+        sem_literal=tuple(
+            i for i, pattern in enumerate(patterns) if pattern not in LITERAIS_PADROES
+        ),
+    )
+
+
+def _varrer_padroes(
+    trecho: str,
+    conjunto: _ConjuntoPadroes,
+    limite: int | None = None,
+) -> dict[int, re.Match[str]]:
+    """
+    Return the first match of each pattern in ``trecho`` using one alternation scan.
+
+    With RE2 installed, its Set reports in one pass which patterns may occur;
+    without it, an Aho-Corasick pass over the casefolded text finds the
+    patterns whose required literal is present. Only those are searched with
+    ``re``. Failing both, the alternation reports one pattern per position, so
+    at every hit the still-missing rivals of that pattern are tried anchored
+    there. Either way the result is identical to one ``search`` per pattern.
+
+    With ``limite``, scanning stops once that many patterns matched (the
+    result is then a subset), e.g. when only a saturated score is needed.
+    """
+    total = len(conjunto.patterns) if limite is None else min(limite, len(conjunto.patterns))
+    primeiros: dict[int, re.Match[str]] = {}
+    candidatos: Any = None
+    if conjunto.conjunto_re2 is not None:
+        candidatos = conjunto.conjunto_re2.Match(trecho) or ()
+    elif conjunto.automato_literais is not None:
+        candidatos = set(conjunto.sem_literal)
+        for _, indices in conjunto.automato_literais.iter(trecho.casefold()):
+            candidatos.update(indices)
+    if candidatos is not None:
+        buscas = conjunto.buscas
+        for indice in candidatos:
+            match = buscas[indice](trecho)
+            if match:
+                primeiros[indice] = match
+                if len(primeiros) >= total:
+                    break
+        return primeiros
+
+    buscar_alternacao = conjunto.alternacao.search
+    indice_por_grupo = conjunto.indice_por_grupo
+    rivais = conjunto.rivais
+    ancoradas = conjunto.ancoradas
+    pos = 0
+    while len(primeiros) < total:
+        match = buscar_alternacao(trecho, pos)
+        if match is None:
+            break
+        inicio = match.start()
+        indice = indice_por_grupo[match.lastindex]
+        primeiros.setdefault(indice, match)
+        for rival in rivais[indice]:
+            if rival not in primeiros:
+                candidato = ancoradas[rival](trecho, inicio)
+                if candidato:
+                    primeiros[rival] = candidato
+        pos = inicio + 1
+    return primeiros
+
+
+_CONJUNTO_RECURSO = _compilar_conjunto(tuple(RECURSO_PATTERNS))
+_CONJUNTO_ACORDAO = _compilar_conjunto(tuple(ACORDAO_PATTERNS))
+# Both verifier classes in one set: indices below the RECURSO count are RECURSO hits.
+_CONJUNTO_VERIFICADOR = _compilar_conjunto(
+    tuple(CHEAP_VERIFIER_RECURSO_PATTERNS) + tuple(CHEAP_VERIFIER_ACORDAO_PATTERNS)
+)
+_TOTAL_VERIFICADOR_RECURSO = len(CHEAP_VERIFIER_RECURSO_PATTERNS)
+
 # Confidence threshold for heuristic classification
 HEURISTIC_CONFIDENCE_THRESHOLD: float = 0.7
 COMPOSITE_WEIGHT_HEURISTIC: float = 0.55
@@ -66,6 +351,7 @@ COMPOSITE_MIN_CONFIDENCE: float = 0.55
 COMPOSITE_MIN_MARGIN: float = 0.12
 COMPOSITE_STRONG_CONFLICT_CONFIDENCE: float = 0.75
 CLASSIFIER_WINDOW_SIZE_CHARS: int = 5000
+CLASSIFICATION_CACHE_MAX_ENTRIES: int = 1024
 
 # LLM classification prompt
 CLASSIFICATION_PROMPT: str = """Você é um classificador de documentos jurídicos.
@@ -104,8 +390,47 @@ Resposta: {"tipo": "ACORDAO", "confianca": 0.95}
 Responda APENAS com JSON:
 {"tipo": "RECURSO" ou "ACORDAO", "confianca": 0.0 a 1.0}"""
 
-
-@dataclass
+CLASSIFICATION_BATCH_PROMPT: str = (
+    CLASSIFICATION_PROMPT.rsplit("Responda APENAS com JSON:", 1)[0]
+    + """Você receberá vários documentos numerados. Classifique cada um de forma independente.
+
+Responda APENAS com JSON, com um item por documento:
+{"documentos": [{"id": 1, "tipo": "RECURSO" ou "ACORDAO", "confianca": 0.0 a 1.0}]}"""
+)
+
+# Structured output: providers that support json_schema stop at the closing brace
+# and never return malformed JSON; others fall back to json_object in the client.
+CLASSIFICATION_RESPONSE_SCHEMA: dict = {
+    "type": "object",
+    "properties": {
+        "tipo": {"type": "string", "enum": ["RECURSO", "ACORDAO"]},
+        "confianca": {"type": "number"},
+    },
+    "required": ["tipo", "confianca"],
+    "additionalProperties": False,
+}
+CLASSIFICATION_BATCH_RESPONSE_SCHEMA: dict = {
+    "type": "object",
+    "properties": {
+        "documentos": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer"},
+                    **CLASSIFICATION_RESPONSE_SCHEMA["properties"],
+                },
+                "required": ["id", "tipo", "confianca"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["documentos"],
+    "additionalProperties": False,
+}
+
+
+@dataclass(slots=True)
 class ClassificationResult:
     """Result of document classification."""
 
@@ -160,18 +485,17 @@ def _normalizar_scores_heuristicos(
     return score_recurso, score_acordao
 
 
-def _score_binario_por_tipo(
+def _scores_binarios(
     tipo_predito: TipoDocumento,
     confianca: float,
-    tipo_alvo: TipoDocumento,
-) -> float:
-    """Convert class prediction into deterministic score for one target label."""
-    conf = _clamp01(confianca)
+) -> tuple[float, float]:
+    """Convert a class prediction into deterministic (RECURSO, ACORDAO) scores."""
     if tipo_predito == TipoDocumento.DESCONHECIDO:
-        return 0.5
-    if tipo_predito == tipo_alvo:
-        return conf
-    return 1.0 - conf
+        return 0.5, 0.5
+    conf = _clamp01(confianca)
+    if tipo_predito == TipoDocumento.RECURSO:
+        return conf, 1.0 - conf
+    return 1.0 - conf, conf
 
 
 def _aplicar_score_composto(
@@ -187,65 +511,32 @@ def _aplicar_score_composto(
         else 0.25
     )
 
-    componentes_recurso: list[tuple[float, float]] = [(heuristic_weight, heur_score_recurso)]
-    componentes_acordao: list[tuple[float, float]] = [(heuristic_weight, heur_score_acordao)]
+    # Weighted sums accumulated in place (same order as the former component lists).
+    total_peso = heuristic_weight
+    soma_recurso = heuristic_weight * heur_score_recurso
+    soma_acordao = heuristic_weight * heur_score_acordao
 
     if resultado_llm is not None:
-        componentes_recurso.append(
-            (
-                COMPOSITE_WEIGHT_LLM,
-                _score_binario_por_tipo(
-                    resultado_llm.tipo,
-                    resultado_llm.confianca,
-                    TipoDocumento.RECURSO,
-                ),
-            )
-        )
-        componentes_acordao.append(
-            (
-                COMPOSITE_WEIGHT_LLM,
-                _score_binario_por_tipo(
-                    resultado_llm.tipo,
-                    resultado_llm.confianca,
-                    TipoDocumento.ACORDAO,
-                ),
-            )
-        )
+        llm_recurso, llm_acordao = _scores_binarios(resultado_llm.tipo, resultado_llm.confianca)
+        total_peso += COMPOSITE_WEIGHT_LLM
+        soma_recurso += COMPOSITE_WEIGHT_LLM * llm_recurso
+        soma_acordao += COMPOSITE_WEIGHT_LLM * llm_acordao
 
     if (
         resultado_base.verifier_tipo is not None
         and resultado_base.verifier_tipo != TipoDocumento.DESCONHECIDO
     ):
-        componentes_recurso.append(
-            (
-                COMPOSITE_WEIGHT_VERIFIER,
-                _score_binario_por_tipo(
-                    resultado_base.verifier_tipo,
-                    resultado_base.verifier_confidence,
-                    TipoDocumento.RECURSO,
-                ),
-            )
-        )
-        componentes_acordao.append(
-            (
-                COMPOSITE_WEIGHT_VERIFIER,
-                _score_binario_por_tipo(
-                    resultado_base.verifier_tipo,
-                    resultado_base.verifier_confidence,
-                    TipoDocumento.ACORDAO,
-                ),
-            )
+        verifier_recurso, verifier_acordao = _scores_binarios(
+            resultado_base.verifier_tipo,
+            resultado_base.verifier_confidence,
         )
+        total_peso += COMPOSITE_WEIGHT_VERIFIER
+        soma_recurso += COMPOSITE_WEIGHT_VERIFIER * verifier_recurso
+        soma_acordao += COMPOSITE_WEIGHT_VERIFIER * verifier_acordao
 
-    total_peso = max(sum(peso for peso, _ in componentes_recurso), 1e-9)
-    score_composto_recurso = round(
-        sum(peso * score for peso, score in componentes_recurso) / total_peso,
-        3,
-    )
-    score_composto_acordao = round(
-        sum(peso * score for peso, score in componentes_acordao) / total_peso,
-        3,
-    )
+    total_peso = max(total_peso, 1e-9)
+    score_composto_recurso = round(soma_recurso / total_peso, 3)
+    score_composto_acordao = round(soma_acordao / total_peso, 3)
     margem_decisao = round(abs(score_composto_recurso - score_composto_acordao), 3)
 
     tipo_vencedor = (
@@ -313,25 +604,30 @@ def _aplicar_score_composto(
 
 def _calcular_score_heuristico(
     texto: str,
-    patterns: list[str],
+    conjunto: _ConjuntoPadroes,
+    trechos: list[str] | None = None,
 ) -> float:
-    """Calculate heuristic confidence score based on pattern matches."""
+    """
+    Calculate heuristic confidence score based on pattern matches.
+
+    ``trechos`` lets the caller reuse windows already cut from ``texto``.
+    """
     if not texto:
         return 0.0
 
-    trechos = _obter_janelas_classificacao(texto)
+    if trechos is None:
+        trechos = _obter_janelas_classificacao(texto)
     if not trechos:
         return 0.0
 
-    total = len(patterns)
+    limite = max(len(conjunto.patterns) * HEURISTIC_SATURATION_RATIO, 1)
     best_score = 0.0
     for trecho in trechos:
-        matches = sum(
-            1 for pattern in patterns
-            if re.search(pattern, trecho, re.IGNORECASE)
-        )
-        score = min(matches / max(total * 0.2, 1), 1.0)
-        best_score = max(best_score, score)
+        # Stop at saturation: further matches cannot raise the score above 1.0.
+        matches = len(_varrer_padroes(trecho, conjunto, conjunto.saturacao))
+        if matches >= conjunto.saturacao:
+            return 1.0
+        best_score = max(best_score, matches / limite)
     return best_score
 
 
@@ -360,44 +656,77 @@ def _obter_janelas_classificacao(texto: str) -> list[str]:
     return deduped
 
 
-def _match_patterns_with_evidence(
-    texto: str,
-    patterns: list[str],
-) -> tuple[list[str], list[str]]:
-    """Return matched patterns and short evidence snippets for audit."""
-    trechos = _obter_janelas_classificacao(texto)
-    matched_patterns: list[str] = []
-    snippets: list[str] = []
-    matched_set: set[str] = set()
+def _score_with_evidence(
+    trechos: list[str],
+    conjunto: _ConjuntoPadroes,
+) -> tuple[float, list[str], list[str]]:
+    """
+    Score a pattern list and collect its audit evidence in one scan per window.
+
+    The score is the best per-window share of matched patterns; matched
+    patterns and snippets are deduplicated across windows.
+    """
+    patterns = conjunto.patterns
+    limite = max(len(patterns) * HEURISTIC_SATURATION_RATIO, 1)
+    best_score = 0.0
+    # Insertion-ordered dicts: O(1) dedup that keeps first-seen order.
+    matched_patterns: dict[str, None] = {}
+    snippets: dict[str, None] = {}
 
     for trecho in trechos:
-        for pattern in patterns:
-            match = re.search(pattern, trecho, re.IGNORECASE)
+        primeiros = _varrer_padroes(trecho, conjunto)
+        best_score = max(best_score, min(len(primeiros) / limite, 1.0))
+        for indice, pattern in enumerate(patterns):
+            match = primeiros.get(indice)
             if not match:
                 continue
-            if pattern not in matched_set:
-                matched_patterns.append(pattern)
-                matched_set.add(pattern)
-            snippet = re.sub(r"\s+", " ", match.group(0)).strip()[:120]
-            if snippet and snippet not in snippets:
-                snippets.append(snippet)
+            matched_patterns.setdefault(pattern, None)
+            snippet = " ".join(match.group(0).split())[:120]
+            if snippet:
+                snippets.setdefault(snippet, None)
 
-    return matched_patterns, snippets
+    return best_score, list(matched_patterns), list(snippets)
 
 
-def _classificar_por_heuristica(texto: str) -> ClassificationResult:
-    """Classify document using text pattern heuristics."""
-    score_recurso = _calcular_score_heuristico(texto, RECURSO_PATTERNS)
-    score_acordao = _calcular_score_heuristico(texto, ACORDAO_PATTERNS)
-    recurso_patterns, recurso_snippets = _match_patterns_with_evidence(
-        texto,
-        RECURSO_PATTERNS,
-    )
-    acordao_patterns, acordao_snippets = _match_patterns_with_evidence(
-        texto,
-        ACORDAO_PATTERNS,
+def _match_patterns_with_evidence(
+    texto: str,
+    patterns: list[str],
+    trechos: list[str] | None = None,
+) -> tuple[list[str], list[str]]:
+    """Return matched patterns and short evidence snippets for audit."""
+    if trechos is None:
+        trechos = _obter_janelas_classificacao(texto)
+    _, matched_patterns, snippets = _score_with_evidence(
+        trechos, _compilar_conjunto(tuple(patterns))
     )
-    evidence_snippets = list(dict.fromkeys((recurso_snippets + acordao_snippets)[:8]))
+    return matched_patterns, snippets
+
+
+def _classificar_por_heuristica(
+    texto: str,
+    collect_evidence: bool = True,
+) -> ClassificationResult:
+    """
+    Classify document using text pattern heuristics.
+
+    With ``collect_evidence=False`` only the scores are computed (scans stop at
+    saturation) and the matched-pattern/snippet lists are left empty.
+    """
+    trechos = _obter_janelas_classificacao(texto)
+    if collect_evidence:
+        score_recurso, recurso_patterns, recurso_snippets = _score_with_evidence(
+            trechos,
+            _CONJUNTO_RECURSO,
+        )
+        score_acordao, acordao_patterns, acordao_snippets = _score_with_evidence(
+            trechos,
+            _CONJUNTO_ACORDAO,
+        )
+        evidence_snippets = list(dict.fromkeys((recurso_snippets + acordao_snippets)[:8]))
+    else:
+        score_recurso = _calcular_score_heuristico(texto, _CONJUNTO_RECURSO, trechos)
+        score_acordao = _calcular_score_heuristico(texto, _CONJUNTO_ACORDAO, trechos)
+        recurso_patterns, acordao_patterns, evidence_snippets = [], [], []
 
     logger.debug(
         "Heurística: score_recurso=%.2f, score_acordao=%.2f",
@@ -444,14 +773,9 @@ def _classificar_por_heuristica(texto: str) -> ClassificationResult:
 def _classificar_por_verificador_barato(texto: str) -> tuple[TipoDocumento, float, str]:
     """Run a cheap cross-check validator for document type."""
     trecho = texto[:5000]
-    hits_recurso = sum(
-        1 for pattern in CHEAP_VERIFIER_RECURSO_PATTERNS
-        if re.search(pattern, trecho, re.IGNORECASE)
-    )
-    hits_acordao = sum(
-        1 for pattern in CHEAP_VERIFIER_ACORDAO_PATTERNS
-        if re.search(pattern, trecho, re.IGNORECASE)
-    )
+    encontrados = _varrer_padroes(trecho, _CONJUNTO_VERIFICADOR)
+    hits_recurso = sum(1 for indice in encontrados if indice < _TOTAL_VERIFICADOR_RECURSO)
+    hits_acordao = len(encontrados) - hits_recurso
 
     total = max(len(CHEAP_VERIFIER_RECURSO_PATTERNS), len(CHEAP_VERIFIER_ACORDAO_PATTERNS), 1)
     if hits_recurso == 0 and hits_acordao == 0:
@@ -508,44 +832,70 @@ def _aplicar_validacao_cruzada_barata(
     return resultado
 
 
+def _resultado_llm(resposta: dict[str, Any], model: str) -> ClassificationResult:
+    """Build the LLM ClassificationResult from one parsed {"tipo", "confianca"} answer."""
+    tipo_str = str(resposta.get("tipo", "")).upper()
+    confianca = float(resposta.get("confianca", 0.0))
+
+    if tipo_str == "RECURSO":
+        tipo = TipoDocumento.RECURSO
+    elif tipo_str == "ACORDAO":
+        tipo = TipoDocumento.ACORDAO
+    else:
+        tipo = TipoDocumento.DESCONHECIDO
+
+    return ClassificationResult(
+        tipo=tipo,
+        confianca=confianca,
+        metodo="llm",
+        llm_model=model,
+        llm_tipo_raw=tipo_str,
+        llm_confianca_raw=confianca,
+    )
+
+
+@lru_cache(maxsize=1)
+def _modulos_llm() -> tuple[ModuleType, ModuleType]:
+    """
+    Import the LLM client and model router on first use, then reuse them.
+
+    Heuristic-only callers never load the LLM stack. Attributes are read from
+    the modules at call time, so patched module attributes are honoured.
+    """
+    from src import llm_client, model_router
+
+    return llm_client, model_router
+
+
 def _classificar_por_llm(texto: str) -> ClassificationResult:
     """Classify document using LLM as fallback (uses gpt-4o-mini for cost savings)."""
-    from src.llm_client import LLMError, chamar_llm_json
-    from src.model_router import TaskType, get_model_for_task
-
     trecho = texto[:2000]
+    if not trecho.strip():
+        # Nothing for the model to read (e.g. scanned PDF without OCR text).
+        logger.info("Texto vazio: classificação por LLM ignorada.")
+        return ClassificationResult(
+            tipo=TipoDocumento.DESCONHECIDO,
+            confianca=0.0,
+            metodo="llm_skipped",
+        )
 
-    model = get_model_for_task(TaskType.CLASSIFICATION)
+    llm_client, model_router = _modulos_llm()
+
+    model = model_router.get_model_for_task(model_router.TaskType.CLASSIFICATION)
 
     try:
-        result = chamar_llm_json(
+        result = llm_client.chamar_llm_json(
             system_prompt=CLASSIFICATION_PROMPT,
             user_message=f"Classifique este documento:\n\n{trecho}",
             temperature=0.0,
             max_tokens=100,
             model=model,  # Use gpt-4o-mini (83% cheaper than gpt-4o)
+            response_schema=CLASSIFICATION_RESPONSE_SCHEMA,
+            schema_name="classificacao_documento",
         )
+        return _resultado_llm(result, model)
 
-        tipo_str = result.get("tipo", "").upper()
-        confianca = float(result.get("confianca", 0.0))
-
-        if tipo_str == "RECURSO":
-            tipo = TipoDocumento.RECURSO
-        elif tipo_str == "ACORDAO":
-            tipo = TipoDocumento.ACORDAO
-        else:
-            tipo = TipoDocumento.DESCONHECIDO
-
-        return ClassificationResult(
-            tipo=tipo,
-            confianca=confianca,
-            metodo="llm",
-            llm_model=model,
-            llm_tipo_raw=tipo_str,
-            llm_confianca_raw=confianca,
-        )
-
-    except LLMError as e:
+    except llm_client.LLMError as e:
         logger.error("Falha na classificação por LLM: %s", e)
         return ClassificationResult(
             tipo=TipoDocumento.DESCONHECIDO,
@@ -555,22 +905,152 @@ def _classificar_por_llm(texto: str) -> ClassificationResult:
         )
 
 
-def classificar_documento(texto: str) -> ClassificationResult:
+def _classificar_lote_por_llm(textos: list[str]) -> list[ClassificationResult]:
+    """
+    Classify several documents with one LLM call, in input order.
+
+    Each document contributes the same 2000-char excerpt as the single-document
+    call; empty excerpts are left out of the prompt. Documents missing from the
+    answer (or all of them, if the call fails) fall back to one
+    ``_classificar_por_llm`` call each.
+    """
+    com_texto = [i for i, texto in enumerate(textos) if texto[:2000].strip()]
+    if len(com_texto) <= 1:
+        return [_classificar_por_llm(texto) for texto in textos]
+
+    llm_client, model_router = _modulos_llm()
+
+    model = model_router.get_model_for_task(model_router.TaskType.CLASSIFICATION)
+    documentos = "\n\n".join(
+        f"=== DOCUMENTO {numero} ===\n{textos[i][:2000]}"
+        for numero, i in enumerate(com_texto, start=1)
+    )
+    resultados: list[ClassificationResult | None] = [None] * len(textos)
+
+    try:
+        result = llm_client.chamar_llm_json(
+            system_prompt=CLASSIFICATION_BATCH_PROMPT,
+            user_message=f"Classifique cada documento:\n\n{documentos}",
+            temperature=0.0,
+            max_tokens=100 * len(com_texto),
+            model=model,
+            response_schema=CLASSIFICATION_BATCH_RESPONSE_SCHEMA,
+            schema_name="classificacao_documentos",
+        )
+        itens = result.get("documentos")
+        for item in itens if isinstance(itens, list) else []:
+            if not isinstance(item, dict):
+                continue
+            try:
+                numero = int(item.get("id", 0))
+                if not 1 <= numero <= len(com_texto):
+                    continue
+                indice = com_texto[numero - 1]
+                if resultados[indice] is None:
+                    resultados[indice] = _resultado_llm(item, model)
+            except (TypeError, ValueError):
+                continue
+    except llm_client.LLMError as e:
+        logger.warning("Falha na classificação em lote por LLM: %s", e)
+
+    faltantes = sum(resultados[i] is None for i in com_texto)
+    if faltantes:
+        logger.warning(
+            "⚠️ Lote LLM sem resposta para %d de %d documentos; classificando individualmente.",
+            faltantes, len(com_texto),
+        )
+    return [
+        resultado if resultado is not None else _classificar_por_llm(texto)
+        for resultado, texto in zip(resultados, textos)
+    ]
+
+
+# Results memoized by text digest (duplicate PDFs, retries, re-ingestion).
+_classification_cache: OrderedDict[bytes, ClassificationResult] = OrderedDict()
+_classification_cache_lock = threading.Lock()
+
+
+def _chave_classificacao(texto: str) -> bytes:
+    """Digest of the full text: heuristics read start, middle and end windows."""
+    return hashlib.blake2b(texto.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+def limpar_cache_classificacao() -> None:
+    """Drop all memoized classification results."""
+    with _classification_cache_lock:
+        _classification_cache.clear()
+
+
+def _obter_do_cache(chave: bytes) -> ClassificationResult | None:
+    """Return a copy of the memoized result for ``chave``, refreshing its LRU position."""
+    with _classification_cache_lock:
+        cached = _classification_cache.get(chave)
+        if cached is not None:
+            _classification_cache.move_to_end(chave)
+    if cached is None:
+        return None
+    logger.debug("Classificação reaproveitada do cache: %s", cached.tipo.value)
+    return copy.deepcopy(cached)
+
+
+def _guardar_no_cache(chave: bytes, resultado: ClassificationResult) -> None:
+    """Memoize ``resultado`` unless it comes from a failed LLM fallback."""
+    if "llm" in resultado.metodo and resultado.llm_confianca_raw is None:
+        return
+    with _classification_cache_lock:
+        _classification_cache[chave] = copy.deepcopy(resultado)
+        while len(_classification_cache) > CLASSIFICATION_CACHE_MAX_ENTRIES:
+            _classification_cache.popitem(last=False)
+
+
+def classificar_documento(texto: str, collect_evidence: bool = True) -> ClassificationResult:
     """
     Classify a document as RECURSO or ACORDAO.
 
-    Uses text heuristics first. Falls back to LLM if confidence < 0.7.
+    Uses text heuristics first. Falls back to LLM if confidence < 0.7. Results are
+    memoized (LRU) by text digest; failed LLM fallbacks are not memoized.
 
     Args:
         texto: Extracted document text.
+        collect_evidence: Gather matched patterns and snippets for the audit;
+            pass False when only the classification is needed.
 
     Returns:
         ClassificationResult with tipo, confidence, and method used.
     """
+    chave = _chave_classificacao(texto) + (b"e" if collect_evidence else b"-")
+    cached = _obter_do_cache(chave)
+    if cached is not None:
+        return cached
+
+    resultado = _classificar_documento_sem_cache(texto, collect_evidence)
+    _guardar_no_cache(chave, resultado)
+    return resultado
+
+
+def _classificar_documento_sem_cache(
+    texto: str,
+    collect_evidence: bool = True,
+) -> ClassificationResult:
+    """Run heuristics, cross-check, composite scoring and the LLM fallback."""
+    resultado_heuristica, resultado = _classificar_sem_llm(texto, collect_evidence)
+    if resultado is not None:
+        return resultado
+    return _combinar_com_llm(texto, resultado_heuristica, _classificar_por_llm(texto))
+
+
+def _classificar_sem_llm(
+    texto: str,
+    collect_evidence: bool = True,
+) -> tuple[ClassificationResult, ClassificationResult | None]:
+    """
+    Run the heuristic stages only.
+
+    Returns the heuristic result and the final result, which is None when the
+    document still needs the LLM fallback.
+    """
     # Try heuristics first
-    resultado_heuristica = _classificar_por_heuristica(texto)
-    resultado_llm: ClassificationResult | None = None
-    resultado_base: ClassificationResult
+    resultado_heuristica = _classificar_por_heuristica(texto, collect_evidence=collect_evidence)
 
     if resultado_heuristica.tipo != TipoDocumento.DESCONHECIDO:
         resultado_base = _aplicar_validacao_cruzada_barata(texto, resultado_heuristica)
@@ -579,14 +1059,21 @@ def classificar_documento(texto: str) -> ClassificationResult:
             "📋 Classificação (heurística): %s (confiança: %.2f)",
             resultado_final.tipo.value, resultado_final.confianca,
         )
-        return resultado_final
+        return resultado_heuristica, resultado_final
 
-    # Fallback to LLM
     logger.info(
         "Heurística inconclusiva (%.2f). Usando LLM...",
         resultado_heuristica.confianca,
     )
-    resultado_llm = _classificar_por_llm(texto)
+    return resultado_heuristica, None
+
+
+def _combinar_com_llm(
+    texto: str,
+    resultado_heuristica: ClassificationResult,
+    resultado_llm: ClassificationResult,
+) -> ClassificationResult:
+    """Attach the heuristic evidence to the LLM answer and apply composite scoring."""
     resultado_llm.heuristic_score_recurso = resultado_heuristica.heuristic_score_recurso
     resultado_llm.heuristic_score_acordao = resultado_heuristica.heuristic_score_acordao
     resultado_llm.matched_recurso_patterns = resultado_heuristica.matched_recurso_patterns
@@ -602,6 +1089,64 @@ def classificar_documento(texto: str) -> ClassificationResult:
     return resultado_final
 
 
+def _classificar_com_lotes_llm(
+    textos: list[str],
+    tamanho_lote: int,
+    workers: int,
+) -> list[ClassificationResult]:
+    """
+    Classify texts sending the inconclusive ones to the LLM in batches.
+
+    Heuristics run for every text first; the texts left inconclusive are then
+    grouped by excerpt length bin, and each bin is split into batches of up to
+    ``tamanho_lote`` for ``_classificar_lote_por_llm``.
+    """
+    chaves = [_chave_classificacao(texto) + b"e" for texto in textos]
+    resultados: list[ClassificationResult | None] = [_obter_do_cache(chave) for chave in chaves]
+    pendentes = [i for i, resultado in enumerate(resultados) if resultado is None]
+
+    preliminares = _mapear_em_paralelo(
+        lambda i: _classificar_sem_llm(textos[i]), pendentes, workers
+    )
+    inconclusivos: list[tuple[int, ClassificationResult]] = []
+    for i, (resultado_heuristica, resultado) in zip(pendentes, preliminares):
+        if resultado is None:
+            inconclusivos.append((i, resultado_heuristica))
+        else:
+            resultados[i] = resultado
+            _guardar_no_cache(chaves[i], resultado)
+
+    # Batches of similar excerpt length (500-char bins, document order kept
+    # within a bin): a batch is as slow as its longest prompt.
+    def _faixa(item: tuple[int, ClassificationResult]) -> int:
+        return min(len(textos[item[0]]), 2000) // 500
+
+    lotes: list[list[tuple[int, ClassificationResult]]] = []
+    for _, grupo in groupby(sorted(inconclusivos, key=_faixa), key=_faixa):
+        itens = list(grupo)
+        lotes.extend(
+            itens[inicio:inicio + tamanho_lote] for inicio in range(0, len(itens), tamanho_lote)
+        )
+    respostas = _mapear_em_paralelo(
+        lambda lote: _classificar_lote_por_llm([textos[i] for i, _ in lote]), lotes, workers
+    )
+    for lote, resposta in zip(lotes, respostas):
+        for (i, resultado_heuristica), resultado_llm in zip(lote, resposta):
+            resultados[i] = _combinar_com_llm(textos[i], resultado_heuristica, resultado_llm)
+            _guardar_no_cache(chaves[i], resultados[i])
+
+    return resultados
+
+
+def _mapear_em_paralelo(funcao: Callable[[Any], Any], itens: list[Any], workers: int) -> list[Any]:
+    """``list(map(funcao, itens))``, on a thread pool when more than one worker is useful."""
+    workers = min(workers, len(itens))
+    if workers <= 1:
+        return [funcao(item) for item in itens]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(funcao, itens))
+
+
 def _avaliar_revisao_manual_classificacao(
     resultado: ClassificationResult,
     *,
@@ -637,6 +1182,8 @@ def classificar_documentos(
     manual_review_mode: bool = False,
     manual_review_confidence_threshold: float = 0.65,
     manual_review_margin_threshold: float = 0.15,
+    max_workers: int = 4,
+    llm_batch_size: int = 1,
 ) -> list[DocumentoEntrada]:
     """
     Classify multiple documents and update their tipo field.
@@ -645,13 +1192,25 @@ def classificar_documentos(
 
     Args:
         documentos: List of DocumentoEntrada to classify.
+        max_workers: Documents classified concurrently (LLM fallbacks overlap).
+        llm_batch_size: Inconclusive documents sent per LLM call; 1 keeps one
+            call per document.
 
     Returns:
         Same list with tipo field updated.
     """
-    for doc in documentos:
-        resultado = classificar_documento(doc.texto_extraido)
+    textos = [doc.texto_extraido for doc in documentos]
+    workers = max(1, max_workers)
+    if llm_batch_size > 1:
+        resultados = _classificar_com_lotes_llm(textos, llm_batch_size, workers)
+    else:
+        resultados = _mapear_em_paralelo(classificar_documento, textos, workers)
+
+    contagem = {TipoDocumento.RECURSO: 0, TipoDocumento.ACORDAO: 0}
+    for doc, resultado in zip(documentos, resultados):
         doc.tipo = resultado.tipo
+        if doc.tipo in contagem:
+            contagem[doc.tipo] += 1
         doc.classification_audit = ClassificationAudit(
             method=resultado.metodo,
             confidence=resultado.confianca,
@@ -697,8 +1256,12 @@ def classificar_documentos(
             len(doc.classification_audit.evidence_snippets),
         )
 
-    recursos, acordaos, desconhecidos = validar_classificacao_documentos(
-        documentos,
+    recursos = contagem[TipoDocumento.RECURSO]
+    acordaos = contagem[TipoDocumento.ACORDAO]
+    desconhecidos = len(documentos) - recursos - acordaos
+    validar_contagens_classificacao(
+        recursos,
+        acordaos,
         strict=strict,
         require_exactly_one_recurso=require_exactly_one_recurso,
         min_acordaos=min_acordaos,
@@ -730,10 +1293,38 @@ def validar_classificacao_documentos(
     Raises:
         DocumentClassificationError: when strict=True and invariants are violated.
     """
-    recursos = sum(1 for d in documentos if d.tipo == TipoDocumento.RECURSO)
-    acordaos = sum(1 for d in documentos if d.tipo == TipoDocumento.ACORDAO)
+    recursos = acordaos = 0
+    for d in documentos:
+        if d.tipo == TipoDocumento.RECURSO:
+            recursos += 1
+        elif d.tipo == TipoDocumento.ACORDAO:
+            acordaos += 1
     desconhecidos = len(documentos) - recursos - acordaos
 
+    validar_contagens_classificacao(
+        recursos,
+        acordaos,
+        strict=strict,
+        require_exactly_one_recurso=require_exactly_one_recurso,
+        min_acordaos=min_acordaos,
+    )
+    return recursos, acordaos, desconhecidos
+
+
+def validar_contagens_classificacao(
+    recursos: int,
+    acordaos: int,
+    *,
+    strict: bool = False,
+    require_exactly_one_recurso: bool = True,
+    min_acordaos: int = 1,
+) -> None:
+    """
+    Validate classification invariants from precomputed per-type counts.
+
+    Raises:
+        DocumentClassificationError: when strict=True and invariants are violated.
+    """
     erros: list[str] = []
 
     if require_exactly_one_recurso:
@@ -755,8 +1346,6 @@ def validar_classificacao_documentos(
         if strict:
             raise DocumentClassificationError(" ".join(erros))
 
-    return recursos, acordaos, desconhecidos
-
 
 def agrupar_documentos(
     documentos: list[DocumentoEntrada],
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import json
 import logging
+import re
 import traceback
 from datetime import datetime
 from pathlib import Path
@@ -28,14 +29,14 @@ logger = logging.getLogger("assessor_ai")
 
 DEAD_LETTER_DIR = OUTPUTS_DIR / "dead_letter"
 
-TRANSIENT_ERROR_NAMES = {
+TRANSIENT_ERROR_NAMES = frozenset({
     "RateLimitError",
     "APITimeoutError",
     "APIConnectionError",
     "TimeoutError",
     "ConnectionError",
     "ServiceUnavailableError",
-}
+})
 
 TRANSIENT_MESSAGE_HINTS = (
     "rate limit",
@@ -45,11 +46,15 @@ TRANSIENT_MESSAGE_HINTS = (
     "connection reset",
     "network",
 )
+_TRANSIENT_MESSAGE_RE = re.compile("|".join(map(re.escape, TRANSIENT_MESSAGE_HINTS)))
+
+# `\w` mirrors str.isalnum() plus "_", so names keep accented letters.
+_UNSAFE_NAME_CHARS_RE = re.compile(r"[^\w-]")
 
 
 def _sanitize_name(raw: str) -> str:
     """Sanitize dynamic names used in filesystem paths."""
-    return "".join(ch if ch.isalnum() or ch in {"-", "_"} else "_" for ch in raw).strip("_") or "default"
+    return _UNSAFE_NAME_CHARS_RE.sub("_", raw).strip("_") or "default"
 
 
 def is_non_transient_error(exc: Exception) -> bool:
@@ -65,7 +70,7 @@ def is_non_transient_error(exc: Exception) -> bool:
         return False
 
     message = str(exc).lower()
-    if any(hint in message for hint in TRANSIENT_MESSAGE_HINTS):
+    if _TRANSIENT_MESSAGE_RE.search(message):
         return False
 
     return True
@@ -34,6 +34,8 @@ from src.config import (
     PROMPT_PROFILE,
     CLASSIFICATION_MANUAL_REVIEW_CONFIDENCE_THRESHOLD,
     CLASSIFICATION_MANUAL_REVIEW_MARGIN_THRESHOLD,
+    CLASSIFICATION_MAX_WORKERS,
+    CLASSIFICATION_LLM_BATCH_SIZE,
     SensitiveDataFilter,
     ensure_sensitive_filter_all_handlers,
     ENABLE_CONTEXT_COVERAGE_GATE,
@@ -1035,6 +1037,8 @@ class PipelineAdmissibilidade:
                     manual_review_margin_threshold=(
                         CLASSIFICATION_MANUAL_REVIEW_MARGIN_THRESHOLD
                     ),
+                    max_workers=CLASSIFICATION_MAX_WORKERS,
+                    llm_batch_size=CLASSIFICATION_LLM_BATCH_SIZE,
                 )
             except Exception:
                 classificacao_erro = True
@@ -7,6 +7,16 @@ import pytest
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
+@pytest.fixture(autouse=True)
+def _reset_classification_cache():
+    """Keep memoized classifications from leaking across tests (mocks differ per test)."""
+    from src.classifier import limpar_cache_classificacao
+
+    limpar_cache_classificacao()
+    yield
+    limpar_cache_classificacao()
+
+
 @pytest.fixture
 def sample_recurso_path() -> str:
     """Path to a valid PDF with recurso text."""
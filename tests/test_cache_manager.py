@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import time
 import os
+import threading
+from collections import OrderedDict
+from enum import Enum
 from pathlib import Path
 
 import src.crypto_utils as cu
 from src.cache_manager import CacheManager
 
 
+class _Etapa(str, Enum):
+    ANALISE = "analise"
+    MINUTA = "minuta"
+
+
 class TestCacheManager:
     """Cache behavior: read/write, TTL, cleanup, and stats."""
 
@@ -27,6 +37,12 @@ class TestCacheManager:
         assert h1 != h3
         assert len(h1) == 16
 
+    def test_hash_keys_match_legacy_hexdigest_prefix(self, tmp_path: Path) -> None:
+        cache = CacheManager(cache_dir=tmp_path / ".cache", ttl_hours=1)
+        expected = hashlib.sha256("same input".encode("utf-8")).hexdigest()[:16]
+
+        assert cache._hash_text("same input") == expected
+
     def test_hash_payload_is_stable_for_equivalent_dict_order(self, tmp_path: Path) -> None:
         cache = CacheManager(cache_dir=tmp_path / ".cache", ttl_hours=1)
         p1 = {"model": "gpt-4o", "params": {"max_tokens": 100, "temperature": 0.0}}
@@ -38,6 +54,24 @@ class TestCacheManager:
         assert h1 == h2
         assert len(h1) == 32
 
+    def test_hash_payload_fast_path_matches_normalized_hash(self, tmp_path: Path) -> None:
+        cache = CacheManager(cache_dir=tmp_path / ".cache", ttl_hours=1)
+        payloads = [
+            "prompt simples",
+            {"b": [1, 2.5, None, True], "a": ("x", {"z": "ç", "y": 0})},
+            {"path": Path("/tmp/x"), "tags": {"b", "a"}, 3: "int key"},
+            {_Etapa.ANALISE: "minuta"},
+            {"etapa": _Etapa.MINUTA, "lista": [_Etapa.ANALISE]},
+        ]
+
+        for payload in payloads:
+            normalized = cache._normalize_for_hash(payload)
+            serialized = json.dumps(
+                normalized, ensure_ascii=False, sort_keys=True, separators=(",", ":")
+            )
+            expected = hashlib.sha256(serialized.encode("utf-8")).hexdigest()[:32]
+            assert cache.hash_payload(payload) == expected
+
     def test_build_multilevel_cache_identity_contains_model_prompt_and_schema(self, tmp_path: Path) -> None:
         cache = CacheManager(cache_dir=tmp_path / ".cache", ttl_hours=1)
         category, key = cache.build_multilevel_cache_identity(
@@ -133,6 +167,27 @@ class TestCacheManager:
         assert deleted == 1
         assert cache.get(stale_key, "llm") is None
 
+    def test_purge_and_clear_remove_stale_orphan_tmp_files(self, tmp_path: Path) -> None:
+        cache = CacheManager(cache_dir=tmp_path / ".cache", ttl_hours=1)
+        key = cache._hash_text("entry")
+        cache.set(key, {"v": 1}, category="llm")
+        entry_file = cache._get_cache_path(key, "llm")
+        stale_tmp = entry_file.with_name(f"{entry_file.name}.1.1.tmp")
+        live_tmp = entry_file.with_name(f"{entry_file.name}.2.2.tmp")
+        stale_tmp.write_bytes(b"{")
+        live_tmp.write_bytes(b"{")
+        old_mtime = time.time() - 3600
+        os.utime(stale_tmp, (old_mtime, old_mtime))
+
+        assert cache.purge_expired() == 0
+        assert not stale_tmp.exists()
+        assert live_tmp.exists()
+        assert cache.get(key, "llm") == {"v": 1}
+
+        os.utime(live_tmp, (old_mtime, old_mtime))
+        assert cache.clear(category="llm") == 1
+        assert not live_tmp.exists()
+
     def test_get_stats_reports_category_counts(self, tmp_path: Path) -> None:
         cache = CacheManager(cache_dir=tmp_path / ".cache", ttl_hours=2)
         cache.set(cache._hash_text("1"), {"v": 1}, category="a")
@@ -183,3 +238,66 @@ class TestCacheManager:
 
         assert cache.get(key, category="llm") is None
         assert not cache_file.exists()
+
+    def test_memory_hit_skips_disk_decode(self, tmp_path: Path, monkeypatch) -> None:
+        cache = CacheManager(cache_dir=tmp_path / ".cache", ttl_hours=1)
+        key = cache._hash_text("hot")
+        cache.set(key, {"v": [1, 2]}, category="llm")
+
+        def _fail(*_args, **_kwargs):
+            raise AssertionError("disk entry should not be decoded on memory hit")
+
+        monkeypatch.setattr("src.cache_manager.decrypt_text", _fail)
+        first = cache.get(key, category="llm")
+        first["v"].append(3)
+
+        assert cache.get(key, category="llm") == {"v": [1, 2]}
+
+    def test_memory_entry_is_dropped_when_file_changes(self, tmp_path: Path) -> None:
+        cache = CacheManager(cache_dir=tmp_path / ".cache", ttl_hours=1)
+        key = cache._hash_text("changed")
+        cache.set(key, {"v": 1}, category="llm")
+        cache_file = cache._get_cache_path(key, "llm")
+
+        cache_file.unlink()
+        assert cache.get(key, category="llm") is None
+
+    def test_memory_lru_is_bounded(self, tmp_path: Path) -> None:
+        cache = CacheManager(cache_dir=tmp_path / ".cache", ttl_hours=1, max_memory_entries=2)
+        for name in ("a", "b", "c"):
+            cache.set(name, {"v": name}, category="llm")
+
+        assert list(cache._memory) == [("llm", "b"), ("llm", "c")]
+        assert cache.get("a", category="llm") == {"v": "a"}
+
+    def test_memory_hit_is_atomic_against_concurrent_invalidate(self, tmp_path: Path) -> None:
+        cache = CacheManager(cache_dir=tmp_path / ".cache", ttl_hours=1)
+        cache.set("k", {"v": 1}, category="llm")
+        other = threading.Thread(target=cache.invalidate, args=("k", "llm"))
+
+        class _RacingDict(OrderedDict):
+            def get(self, key, default=None):
+                value = super().get(key, default)
+                # Another worker drops the entry right after the lookup.
+                other.start()
+                other.join(timeout=0.2)
+                return value
+
+        cache._memory = _RacingDict(cache._memory)
+        assert cache.get("k", category="llm") == {"v": 1}
+        other.join()
+        assert ("llm", "k") not in cache._memory
+
+    def test_set_failure_keeps_previous_entry_and_no_temp_files(self, tmp_path: Path, monkeypatch) -> None:
+        cache = CacheManager(cache_dir=tmp_path / ".cache", ttl_hours=1, max_memory_entries=0)
+        cache.set("k", {"v": "old"}, category="llm")
+
+        def _fail_replace(*_args, **_kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("src.cache_manager.os.replace", _fail_replace)
+        cache.set("k", {"v": "new"}, category="llm")
+        monkeypatch.undo()
+
+        assert cache.get("k", category="llm") == {"v": "old"}
+        assert [p.name for p in (tmp_path / ".cache" / "llm").iterdir()] == ["k.json"]
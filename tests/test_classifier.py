@@ -1,6 +1,8 @@
 """Tests for document classifier (Sprint 2.2)."""
 
 import json
+import re
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -8,9 +10,13 @@ import pytest
 
 from src.classifier import (
     CLASSIFICATION_PROMPT,
+    LITERAIS_PADROES,
     ClassificationResult,
     DocumentClassificationError,
+    RECURSO_PATTERNS,
+    _compilar_conjunto,
     _match_patterns_with_evidence,
+    _varrer_padroes,
     _classificar_por_heuristica,
     _classificar_por_verificador_barato,
     agrupar_documentos,
@@ -202,6 +208,52 @@ class TestHeuristicaDesconhecido:
         assert matched.count(r"Recurso\s+Especial") == 1
         assert snippets.count("PROJUDI - Recurso") == 1
 
+    def test_single_scan_finds_patterns_overlapping_at_same_position(self) -> None:
+        texto = "PROJUDI - Recurso Especial; agravo interno; recurso extraordinario"
+        conjunto = _compilar_conjunto(tuple(RECURSO_PATTERNS))
+        primeiros = _varrer_padroes(texto, conjunto)
+
+        esperado = {
+            i: regex.search(texto).span()
+            for i, regex in enumerate(conjunto.compilados)
+            if regex.search(texto)
+        }
+        assert {i: m.span() for i, m in primeiros.items()} == esperado
+        assert RECURSO_PATTERNS.index(r"Recurso\s+Especial") in primeiros
+
+    @pytest.mark.parametrize(
+        "texto",
+        [
+            "AREspá sem fronteira de palavra",
+            "RECURSO ESPECİAL com I pontilhado",
+            "Recurso\u00a0Extraordinário com espaço não separável",
+        ],
+    )
+    def test_single_scan_matches_re_semantics_on_unicode_edge_cases(self, texto: str) -> None:
+        conjunto = _compilar_conjunto(tuple(RECURSO_PATTERNS))
+        primeiros = _varrer_padroes(texto, conjunto)
+
+        esperado = {
+            i: regex.search(texto).span()
+            for i, regex in enumerate(conjunto.compilados)
+            if regex.search(texto)
+        }
+        assert {i: m.span() for i, m in primeiros.items()} == esperado
+
+    def test_literal_prefilter_covers_every_pattern_match(self) -> None:
+        amostras = list(_load_cls006_fixture().values()) + [
+            item["texto"] for item in _load_cls008_reference_docs()
+        ]
+        amostras.append("RECURSO ESPECİAL; ACÓRDÃO; Câmara Cível; Relatora: ; AREsp")
+
+        for pattern, literais in LITERAIS_PADROES.items():
+            regex = re.compile(pattern, re.IGNORECASE)
+            for texto in amostras:
+                match = regex.search(texto)
+                if match:
+                    trecho = match.group(0).casefold()
+                    assert any(literal in trecho for literal in literais), pattern
+
 
 # --- 2.4.5: LLM fallback ---
 
@@ -233,6 +285,76 @@ class TestFallbackLLM:
             assert "heuristica" in resultado.metodo
             assert "score_composto" in resultado.metodo
 
+    @patch("src.classifier._classificar_por_llm")
+    def test_repeated_text_is_served_from_cache(self, mock_llm) -> None:
+        mock_llm.return_value = ClassificationResult(
+            tipo=TipoDocumento.RECURSO,
+            confianca=0.85,
+            metodo="llm",
+            llm_confianca_raw=0.85,
+        )
+        primeiro = classificar_documento("texto genérico repetido")
+        primeiro.tipo = TipoDocumento.ACORDAO
+        segundo = classificar_documento("texto genérico repetido")
+
+        mock_llm.assert_called_once()
+        assert segundo.tipo == TipoDocumento.RECURSO
+
+    @patch("src.classifier._classificar_por_llm")
+    def test_failed_llm_fallback_is_not_cached(self, mock_llm) -> None:
+        mock_llm.return_value = ClassificationResult(
+            tipo=TipoDocumento.DESCONHECIDO,
+            confianca=0.0,
+            metodo="llm",
+        )
+        classificar_documento("texto genérico com falha")
+        classificar_documento("texto genérico com falha")
+
+        assert mock_llm.call_count == 2
+
+    def test_blank_text_skips_llm_call(self, monkeypatch) -> None:
+        def _should_not_call(**_kwargs) -> dict[str, object]:
+            raise AssertionError("LLM não deve ser chamado para texto vazio")
+
+        monkeypatch.setattr("src.llm_client.chamar_llm_json", _should_not_call)
+        resultado = classificar_documento("   \n\t  ")
+
+        assert resultado.tipo == TipoDocumento.DESCONHECIDO
+        assert resultado.metodo.startswith("llm_skipped")
+
+    def test_collect_evidence_false_keeps_scores_and_skips_evidence(self) -> None:
+        texto = "PROJUDI - Recurso: Recurso Especial razões recursais art. 105, III"
+        completo = classificar_documento(texto)
+        sem_evidencia = classificar_documento(texto, collect_evidence=False)
+
+        assert sem_evidencia.tipo == completo.tipo
+        assert sem_evidencia.confianca == completo.confianca
+        assert sem_evidencia.heuristic_score_recurso == completo.heuristic_score_recurso
+        assert completo.evidence_snippets
+        assert sem_evidencia.evidence_snippets == []
+        assert sem_evidencia.matched_recurso_patterns == []
+
+    @patch("src.classifier._classificar_por_llm")
+    def test_one_sided_sub_threshold_heuristic_uses_llm(self, mock_llm) -> None:
+        # Real verifier: RECURSO-only evidence below the heuristic threshold still goes to the LLM.
+        mock_llm.return_value = ClassificationResult(
+            tipo=TipoDocumento.RECURSO,
+            confianca=0.9,
+            metodo="llm",
+        )
+        classificar_documento("Agravo em Recurso Extraordinário interposto pela parte.")
+        mock_llm.assert_called_once()
+
+    @patch("src.classifier._classificar_por_llm")
+    def test_one_sided_heuristic_without_verifier_support_uses_llm(self, mock_llm) -> None:
+        mock_llm.return_value = ClassificationResult(
+            tipo=TipoDocumento.RECURSO,
+            confianca=0.9,
+            metodo="llm",
+        )
+        classificar_documento("Trata-se de Recurso Especial.")
+        mock_llm.assert_called_once()
+
     @patch("src.classifier._classificar_por_heuristica")
     def test_crosscheck_downgrades_conflicting_primary_classification(self, mock_heuristica) -> None:
         mock_heuristica.return_value = ClassificationResult(
@@ -292,7 +414,7 @@ class TestClassifierPromptFewShot:
 
         monkeypatch.setattr(
             "src.classifier._classificar_por_heuristica",
-            lambda _texto: ClassificationResult(
+            lambda _texto, **_kwargs: ClassificationResult(
                 tipo=TipoDocumento.DESCONHECIDO,
                 confianca=0.15,
                 metodo="heuristica",
@@ -312,12 +434,15 @@ class TestClassifierPromptFewShot:
             temperature: float,
             max_tokens: int,
             model: str,
+            response_schema: dict,
+            schema_name: str,
         ) -> dict[str, object]:
             assert "EXEMPLO LIMITROFE EMBARGOS" in system_prompt
             assert "EXEMPLO LIMITROFE AGRAVO REGIMENTAL" in system_prompt
             assert model == "gpt-4.1-mini"
             assert temperature == 0.0
             assert max_tokens == 100
+            assert response_schema["properties"]["tipo"]["enum"] == ["RECURSO", "ACORDAO"]
 
             text = user_message.lower()
             recurso_terms = [
@@ -393,6 +518,177 @@ class TestClassificarDocumentos:
         assert 0.0 <= result[0].classification_audit.composite_score_acordao <= 1.0
         assert 0.0 <= result[0].classification_audit.decision_margin <= 1.0
 
+    def test_llm_fallbacks_run_concurrently_and_keep_document_order(self) -> None:
+        barreira = threading.Barrier(2, timeout=5)
+
+        def _fake_llm(texto: str) -> ClassificationResult:
+            barreira.wait()
+            tipo = TipoDocumento.RECURSO if "primeiro" in texto else TipoDocumento.ACORDAO
+            return ClassificationResult(tipo=tipo, confianca=0.95, metodo="llm")
+
+        docs = [
+            DocumentoEntrada(filepath="a.pdf", texto_extraido="primeiro texto genérico"),
+            DocumentoEntrada(filepath="b.pdf", texto_extraido="segundo texto genérico"),
+        ]
+        with patch("src.classifier._classificar_por_llm", side_effect=_fake_llm):
+            result = classificar_documentos(docs, max_workers=2)
+
+        assert [d.filepath for d in result] == ["a.pdf", "b.pdf"]
+        assert all("llm" in d.classification_audit.method for d in result)
+
+    def test_llm_batch_classifies_inconclusive_documents_in_one_call(self, monkeypatch) -> None:
+        chamadas: list[str] = []
+
+        def _fake_chamar_llm_json(**kwargs) -> dict[str, object]:
+            chamadas.append(kwargs["user_message"])
+            assert "DOCUMENTO 3" in kwargs["user_message"]
+            return {
+                "documentos": [
+                    {"id": 3, "tipo": "RECURSO", "confianca": 0.9},
+                    {"id": 1, "tipo": "ACORDAO", "confianca": 0.9},
+                    {"id": 2, "tipo": "ACORDAO", "confianca": 0.8},
+                ]
+            }
+
+        monkeypatch.setattr("src.model_router.get_model_for_task", lambda _task: "gpt-4.1-mini")
+        monkeypatch.setattr("src.llm_client.chamar_llm_json", _fake_chamar_llm_json)
+        docs = [
+            DocumentoEntrada(filepath=f"{nome}.pdf", texto_extraido=f"{nome} texto genérico")
+            for nome in ("a", "b", "c")
+        ]
+
+        result = classificar_documentos(
+            docs,
+            require_exactly_one_recurso=False,
+            min_acordaos=0,
+            llm_batch_size=4,
+        )
+
+        assert len(chamadas) == 1
+        assert [d.classification_audit.llm_tipo_raw for d in result] == [
+            "ACORDAO", "ACORDAO", "RECURSO",
+        ]
+
+    def test_llm_batch_groups_documents_of_similar_length(self, monkeypatch) -> None:
+        lotes: list[str] = []
+
+        def _fake_chamar_llm_json(**kwargs) -> dict[str, object]:
+            lotes.append(kwargs["user_message"])
+            return {
+                "documentos": [
+                    {"id": 1, "tipo": "ACORDAO", "confianca": 0.9},
+                    {"id": 2, "tipo": "ACORDAO", "confianca": 0.9},
+                ]
+            }
+
+        monkeypatch.setattr("src.model_router.get_model_for_task", lambda _task: "gpt-4.1-mini")
+        monkeypatch.setattr("src.llm_client.chamar_llm_json", _fake_chamar_llm_json)
+        docs = [
+            DocumentoEntrada(filepath="curto1.pdf", texto_extraido="curto um"),
+            DocumentoEntrada(filepath="longo1.pdf", texto_extraido="longo um " + "x" * 1500),
+            DocumentoEntrada(filepath="curto2.pdf", texto_extraido="curto dois"),
+            DocumentoEntrada(filepath="longo2.pdf", texto_extraido="longo dois " + "x" * 1500),
+        ]
+
+        classificar_documentos(
+            docs,
+            require_exactly_one_recurso=False,
+            min_acordaos=0,
+            max_workers=1,
+            llm_batch_size=2,
+        )
+
+        assert len(lotes) == 2
+        assert "curto um" in lotes[0] and "curto dois" in lotes[0]
+        assert "longo um" in lotes[1] and "longo dois" in lotes[1]
+
+    def test_llm_batch_never_spans_two_length_bins(self, monkeypatch) -> None:
+        lotes: list[str] = []
+
+        def _fake_chamar_llm_json(**kwargs) -> dict[str, object]:
+            lotes.append(kwargs["user_message"])
+            total = kwargs["user_message"].count("curto") + kwargs["user_message"].count("longo")
+            return {
+                "documentos": [
+                    {"id": n, "tipo": "ACORDAO", "confianca": 0.9} for n in range(1, total + 1)
+                ]
+            }
+
+        monkeypatch.setattr("src.model_router.get_model_for_task", lambda _task: "gpt-4.1-mini")
+        monkeypatch.setattr("src.llm_client.chamar_llm_json", _fake_chamar_llm_json)
+        docs = [
+            DocumentoEntrada(filepath="curto1.pdf", texto_extraido="curto um"),
+            DocumentoEntrada(filepath="curto2.pdf", texto_extraido="curto dois"),
+            DocumentoEntrada(filepath="curto3.pdf", texto_extraido="curto tres"),
+            DocumentoEntrada(filepath="longo1.pdf", texto_extraido="longo um " + "x" * 1500),
+        ]
+
+        classificar_documentos(
+            docs,
+            require_exactly_one_recurso=False,
+            min_acordaos=0,
+            max_workers=1,
+            llm_batch_size=2,
+        )
+
+        assert len(lotes) == 3
+        assert all(not ("curto" in lote and "longo" in lote) for lote in lotes)
+        assert sum(lote.count("curto") for lote in lotes) == 3
+
+    def test_llm_batch_leaves_blank_documents_out_of_the_prompt(self, monkeypatch) -> None:
+        chamadas: list[str] = []
+
+        def _fake_chamar_llm_json(**kwargs) -> dict[str, object]:
+            chamadas.append(kwargs["user_message"])
+            return {
+                "documentos": [
+                    {"id": 1, "tipo": "RECURSO", "confianca": 0.9},
+                    {"id": 2, "tipo": "ACORDAO", "confianca": 0.9},
+                ]
+            }
+
+        monkeypatch.setattr("src.model_router.get_model_for_task", lambda _task: "gpt-4.1-mini")
+        monkeypatch.setattr("src.llm_client.chamar_llm_json", _fake_chamar_llm_json)
+        docs = [
+            DocumentoEntrada(filepath="a.pdf", texto_extraido="primeiro texto genérico"),
+            DocumentoEntrada(filepath="vazio.pdf", texto_extraido="  "),
+            DocumentoEntrada(filepath="b.pdf", texto_extraido="segundo texto genérico"),
+        ]
+
+        result = classificar_documentos(docs, min_acordaos=0, llm_batch_size=3)
+
+        assert len(chamadas) == 1
+        assert "DOCUMENTO 3" not in chamadas[0]
+        assert result[1].tipo == TipoDocumento.DESCONHECIDO
+        assert result[0].classification_audit.llm_tipo_raw == "RECURSO"
+        assert result[2].classification_audit.llm_tipo_raw == "ACORDAO"
+
+    def test_llm_batch_falls_back_per_document_for_missing_answers(self, monkeypatch) -> None:
+        monkeypatch.setattr("src.model_router.get_model_for_task", lambda _task: "gpt-4.1-mini")
+        monkeypatch.setattr(
+            "src.llm_client.chamar_llm_json",
+            lambda **_kwargs: {"documentos": [{"id": 1, "tipo": "RECURSO", "confianca": 0.9}]},
+        )
+        docs = [
+            DocumentoEntrada(filepath="a.pdf", texto_extraido="primeiro texto genérico"),
+            DocumentoEntrada(filepath="b.pdf", texto_extraido="segundo texto genérico"),
+        ]
+
+        with patch(
+            "src.classifier._classificar_por_llm",
+            return_value=ClassificationResult(
+                tipo=TipoDocumento.ACORDAO,
+                confianca=0.9,
+                metodo="llm",
+                llm_tipo_raw="ACORDAO",
+                llm_confianca_raw=0.9,
+            ),
+        ) as mock_llm:
+            result = classificar_documentos(docs, llm_batch_size=2)
+
+        mock_llm.assert_called_once_with("segundo texto genérico")
+        assert [d.classification_audit.llm_tipo_raw for d in result] == ["RECURSO", "ACORDAO"]
+
     def test_persists_classification_evidence(self) -> None:
         docs = [
             DocumentoEntrada(
@@ -156,6 +156,14 @@ class TestConfigDefaults:
         raw = "Recorrente: João da Silva CPF 123.456.789-09"
         assert sanitize_log_text(raw) == raw
 
+    def test_log_sanitization_follows_current_level(self, monkeypatch) -> None:
+        raw = "Recorrente: João da Silva CPF 123.456.789-09"
+        monkeypatch.setattr("src.config.LOG_SANITIZE_LEVEL", "full")
+        assert "[REDACTED_PARTY_NAME]" in sanitize_log_text(raw)
+        assert sanitize_log_text(raw) == sanitize_log_text(raw)
+        monkeypatch.setattr("src.config.LOG_SANITIZE_LEVEL", "off")
+        assert sanitize_log_text(raw) == raw
+
     def test_validate_environment_settings_detects_invalid_provider(self, monkeypatch) -> None:
         monkeypatch.setattr("src.config.LLM_PROVIDER", "invalid-provider")
         erros = validate_environment_settings()
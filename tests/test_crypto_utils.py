@@ -49,6 +49,23 @@ class TestSemChave:
         # Should be valid JSON (plaintext mode)
         assert json.loads(blob.decode("utf-8")) == data
 
+    def test_encrypt_sem_chave_mantem_formato_do_json_stdlib(self) -> None:
+        data = {"nome": "João", 1: [2**70, {"x": None}]}
+        blob = cu.encrypt_json(data, "")
+        assert json.loads(blob.decode("utf-8")) == json.loads(
+            json.dumps(data, ensure_ascii=False, indent=2)
+        )
+
+    def test_encrypt_mantem_floats_nao_finitos(self) -> None:
+        key = cu.generate_key()
+        data = {"nan": float("nan"), "inf": float("inf"), "-inf": float("-inf")}
+        plaintext = cu.encrypt_json(data, "")
+        assert plaintext == json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        result = cu.decrypt_json(cu.encrypt_json(data, key), key)
+        assert result["nan"] != result["nan"]
+        assert result["inf"] == float("inf")
+        assert result["-inf"] == float("-inf")
+
     def test_decrypt_sem_chave_le_json_texto(self) -> None:
         data = {"campo": "valor"}
         raw = json.dumps(data, ensure_ascii=False).encode("utf-8")
@@ -29,6 +29,16 @@ class TestDeadLetterQueue:
         RateLimitError = type("RateLimitError", (Exception,), {})
         assert dlq.is_non_transient_error(RateLimitError("quota excedida")) is False
 
+    def test_is_non_transient_error_rejects_transient_by_message(self, monkeypatch) -> None:
+        monkeypatch.setattr(dlq, "ENABLE_DEAD_LETTER_QUEUE", True)
+        assert dlq.is_non_transient_error(RuntimeError("HTTP 429 Too Many Requests")) is False
+        assert dlq.is_non_transient_error(RuntimeError("Connection RESET by peer")) is False
+
+    def test_sanitize_name_replaces_each_unsafe_char(self) -> None:
+        assert dlq._sanitize_name("proc//123") == "proc__123"
+        assert dlq._sanitize_name("ação-1_x") == "ação-1_x"
+        assert dlq._sanitize_name("/../") == "default"
+
     def test_salvar_dead_letter_persists_snapshot(self, tmp_path: Path, monkeypatch) -> None:
         key = cu.generate_key()
         monkeypatch.setattr(dlq, "ENABLE_DEAD_LETTER_QUEUE", True)
@@ -0,0 +1,216 @@
+"""Tests for the reference-minutes import script (scripts/importar_minutas.py)."""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+import scripts.importar_minutas as im
+
+
+class TestExtrairTextoPdf:
+    """PyMuPDF first, pdftotext when PyMuPDF text is missing or partial."""
+
+    @pytest.fixture(autouse=True)
+    def _sem_pdftotext_real(self, monkeypatch) -> None:
+        monkeypatch.setattr(im, "_extrair_texto_pdftotext", lambda _path: "texto do pdftotext")
+
+    def test_usa_pymupdf_quando_todas_as_paginas_sao_lidas(self, monkeypatch) -> None:
+        monkeypatch.setattr(im, "_extrair_texto_pymupdf", lambda _path: ("texto completo", True))
+        assert im.extrair_texto_pdf(Path("x.pdf")) == "texto completo"
+
+    def test_usa_pdftotext_quando_alguma_pagina_falha(self, monkeypatch) -> None:
+        monkeypatch.setattr(im, "_extrair_texto_pymupdf", lambda _path: ("parcial", False))
+        assert im.extrair_texto_pdf(Path("x.pdf")) == "texto do pdftotext"
+
+    def test_usa_pdftotext_quando_pymupdf_nao_extrai_texto(self, monkeypatch) -> None:
+        monkeypatch.setattr(im, "_extrair_texto_pymupdf", lambda _path: ("", True))
+        assert im.extrair_texto_pdf(Path("x.pdf")) == "texto do pdftotext"
+
+    def test_mantem_texto_parcial_se_pdftotext_falhar(self, monkeypatch) -> None:
+        monkeypatch.setattr(im, "_extrair_texto_pymupdf", lambda _path: ("parcial", False))
+        monkeypatch.setattr(im, "_extrair_texto_pdftotext", lambda _path: "[ERRO AO EXTRAIR: x]")
+        assert im.extrair_texto_pdf(Path("x.pdf")) == "parcial"
+
+
+class TestImportarPdf:
+    """Hash-based reuse runs in the worker, under the per-PDF error handling."""
+
+    def test_reaproveita_pdf_com_hash_inalterado(self, tmp_path: Path, monkeypatch) -> None:
+        pdf = tmp_path / "minuta.pdf"
+        pdf.write_bytes(b"%PDF-1.4 conteudo")
+        monkeypatch.setattr(im, "processar_pdf", lambda *_a, **_k: pytest.fail("não deveria processar"))
+
+        assert im.importar_pdf(pdf, tmp_path, hash_antigo=im.hash_pdf(pdf)) is None
+
+    def test_processa_pdf_alterado_reextraindo_o_texto(self, tmp_path: Path, monkeypatch) -> None:
+        pdf = tmp_path / "minuta.pdf"
+        pdf.write_bytes(b"%PDF-1.4 conteudo novo")
+        chamadas: list[tuple] = []
+        monkeypatch.setattr(im, "processar_pdf", lambda *a, **k: chamadas.append((a, k)) or {})
+
+        im.importar_pdf(pdf, tmp_path, hash_antigo="0" * 16)
+
+        (args, kwargs), = chamadas
+        assert args[3] == im.hash_pdf(pdf)
+        assert kwargs == {"reextrair": True}
+
+    def test_full_scan_de_pdf_inalterado_reaproveita_o_texto_salvo(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        pdf = tmp_path / "minuta.pdf"
+        pdf.write_bytes(b"%PDF-1.4 conteudo")
+        chamadas: list[tuple] = []
+        monkeypatch.setattr(im, "processar_pdf", lambda *a, **k: chamadas.append((a, k)) or {})
+
+        im.importar_pdf(
+            pdf, tmp_path, full_scan=True, hash_antigo=im.hash_pdf(pdf), reaproveitar=False
+        )
+
+        (args, kwargs), = chamadas
+        assert args[2] is True
+        assert kwargs == {"reextrair": False}
+
+    def test_main_registra_erro_de_pdf_ilegivel_e_salva_indice(self, tmp_path: Path, monkeypatch) -> None:
+        pdfs_dir = tmp_path / "pdfs"
+        pdfs_dir.mkdir()
+        (pdfs_dir / "a.pdf").write_bytes(b"%PDF-1.4 a")
+        (pdfs_dir / "b.pdf").mkdir()  # hash_pdf falha (IsADirectoryError)
+        monkeypatch.setattr(im, "PDFS_DIR", pdfs_dir)
+        monkeypatch.setattr(im, "TEXTOS_DIR", tmp_path / "textos")
+        monkeypatch.setattr(im, "INDEX_FILE", tmp_path / "index.json")
+        monkeypatch.setattr(im, "fitz", None)
+        monkeypatch.setattr(im, "_extrair_texto_pdftotext", lambda _path: "Recurso Especial inadmito")
+        monkeypatch.setattr("sys.argv", ["importar_minutas.py", "--workers", "1"])
+
+        im.main()
+
+        indice = json.loads((tmp_path / "index.json").read_text(encoding="utf-8"))
+        assert [item["id"] for item in indice] == ["a"]
+
+    def test_main_reaproveita_pdf_inalterado_preservando_avaliacao(
+        self, tmp_path: Path, monkeypatch, capsys
+    ) -> None:
+        pdfs_dir = tmp_path / "pdfs"
+        pdfs_dir.mkdir()
+        (pdfs_dir / "a.pdf").write_bytes(b"%PDF-1.4 a")
+        (pdfs_dir / "b.pdf").write_bytes(b"%PDF-1.4 b alterado")
+        index_file = tmp_path / "index.json"
+        index_file.write_text(json.dumps([
+            {
+                "id": "a", "arquivo": "a.pdf", "pdf_hash": im.hash_pdf(pdfs_dir / "a.pdf"),
+                "tipo_recurso": "recurso_especial", "decisao": "inadmitido",
+                "importado_em": "2025-01-01T00:00:00", "avaliacao": "aprovada",
+            },
+            {
+                "id": "b", "arquivo": "b.pdf", "pdf_hash": "0" * 16,
+                "importado_em": "2025-01-01T00:00:00", "avaliacao": "reprovada",
+                "notas_revisao": "revisar súmula", "assessor_revisor": "ana",
+            },
+        ]), encoding="utf-8")
+        monkeypatch.setattr(im, "PDFS_DIR", pdfs_dir)
+        monkeypatch.setattr(im, "TEXTOS_DIR", tmp_path / "textos")
+        monkeypatch.setattr(im, "INDEX_FILE", index_file)
+        monkeypatch.setattr(im, "fitz", None)
+        monkeypatch.setattr(im, "_extrair_texto_pdftotext", lambda _path: "Recurso Especial. Admito.")
+        monkeypatch.setattr("sys.argv", ["importar_minutas.py", "--workers", "1"])
+
+        im.main()
+
+        a, b = json.loads(index_file.read_text(encoding="utf-8"))
+        assert a["avaliacao"] == "aprovada"
+        assert a["importado_em"] == "2025-01-01T00:00:00"
+        assert not (tmp_path / "textos" / "a.txt").exists()
+        assert b["pdf_hash"] == im.hash_pdf(pdfs_dir / "b.pdf")
+        assert b["decisao"] == "admitido"
+        assert (b["avaliacao"], b["notas_revisao"], b["assessor_revisor"]) == (
+            "reprovada", "revisar súmula", "ana"
+        )
+        progresso = re.findall(r"\[\s*(\d+)/2\]", capsys.readouterr().out)
+        assert sorted(progresso) == ["1", "2"]
+
+
+# Cabeçalho e dispositivo nas pontas, fundamentação longa no meio (> janelas).
+_CABECALHO = (
+    "TRIBUNAL DE JUSTIÇA DO ESTADO DO PARANÁ\n"
+    "1ª Vice-Presidência\n"
+    "RECURSO ESPECIAL CÍVEL Nº 0001234-56.2023.8.16.0001, DA 5ª Câmara Cível\n"
+    "Recorrente: Fulano\n"
+)
+_FUNDAMENTACAO = (
+    "A parte sustenta violação a dispositivos de lei federal, invocando a Súmula 7/STJ "
+    "e a súmula nº 282 do STF, bem como a divergência jurisprudencial.\n"
+) * 200
+_DISPOSITIVOS = {
+    "inadmitido": "Diante do exposto, inadmito o Recurso Especial.\nCuritiba, data da assinatura.",
+    "admitido": "Diante do exposto, admito o Recurso Especial.\nCuritiba, data da assinatura.",
+    "diligencia": "Antes de decidir, intime-se a parte recorrente para comprovar o preparo.",
+}
+
+
+class TestVarrerTexto:
+    """Head/tail windows must classify like the --full-scan path."""
+
+    @pytest.mark.parametrize("decisao", sorted(_DISPOSITIVOS))
+    def test_janelas_classificam_como_full_scan(self, decisao: str) -> None:
+        texto = _CABECALHO + _FUNDAMENTACAO + _DISPOSITIVOS[decisao]
+        assert len(texto) > im.JANELA_INICIO_CHARS + im.JANELA_FIM_CHARS
+
+        janela = im.varrer_texto(im.regiao_classificacao(texto))
+        completo = im.varrer_texto(texto, texto.lower())
+
+        for campo in ("tipo_recurso", "decisao", "camara", "numero_processo"):
+            assert janela[campo] == completo[campo]
+        assert janela["decisao"] == decisao
+        assert janela["tipo_recurso"] == "recurso_especial"
+        assert janela["camara"] == "5ª Câmara Cível"
+        assert janela["numero_processo"] == "0001234-56.2023.8.16.0001"
+
+    def test_texto_curto_usa_o_texto_inteiro(self) -> None:
+        texto = _CABECALHO + _DISPOSITIVOS["admitido"]
+        assert im.regiao_classificacao(texto) == texto
+
+    def test_janelas_mantem_inicio_e_fim(self) -> None:
+        texto = "a" * im.JANELA_INICIO_CHARS + "MEIO" + "z" * im.JANELA_FIM_CHARS
+        regiao = im.regiao_classificacao(texto)
+        assert "MEIO" not in regiao
+        assert regiao == "a" * im.JANELA_INICIO_CHARS + "\n" + "z" * im.JANELA_FIM_CHARS
+
+
+# Implementação original (finditer com re.I sobre o texto original).
+_RE_SUMULA_ORIGINAL = re.compile(r"s[úu]mula[s]?\s+n?[oº°]?\s*(\d+)(?:/([A-Z]+))?", re.I)
+
+
+def _extrair_sumulas_original(texto: str) -> list[str]:
+    sumulas = set()
+    for m in _RE_SUMULA_ORIGINAL.finditer(texto):
+        orgao = m.group(2) or ""
+        sumulas.add(f"{m.group(1)}/{orgao.upper()}" if orgao else m.group(1))
+    return sorted(sumulas)
+
+
+class TestExtrairSumulas:
+    """extrair_sumulas (find + match ancorado) keeps the original finditer output."""
+
+    @pytest.mark.parametrize(
+        "texto",
+        [
+            "Incide a Súmula 7/STJ e a SÚMULA nº 83/stj.",
+            "súmulas 282 e 356/STF; sumula n° 5; Súmula º 126/Stf.",
+            "Súmulas  Súmula 211, súmula7 e súmula n 284/STJ.",
+            "resumula 5 e consúmula 9/ABC no meio do texto",
+            "sem qualquer referência",
+            "",
+            _FUNDAMENTACAO + _DISPOSITIVOS["inadmitido"],
+        ],
+    )
+    def test_mesmo_resultado_da_implementacao_original(self, texto: str) -> None:
+        assert im.extrair_sumulas(texto) == _extrair_sumulas_original(texto)
+        assert im.extrair_sumulas(texto, texto.lower()) == _extrair_sumulas_original(texto)
+
+    def test_varrer_texto_concorda_com_extrair_sumulas(self) -> None:
+        texto = _CABECALHO + _FUNDAMENTACAO[:500] + _DISPOSITIVOS["inadmitido"]
+        assert im.varrer_texto(texto)["sumulas"] == im.extrair_sumulas(texto) == ["282", "7/STJ"]